@@ -1,21 +1,161 @@
-from fastapi import FastAPI
+import argparse
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 import uvicorn
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationError
+
+from logging_setup import setup_logging
+
+# 로그 파일: 운영 모드(멀티 워커)에서는 같은 파일을 여러 프로세스가 회전하지 않도록 프로세스마다 따로 기록
+API_LOG_FILE = 'logs/api.log'
+API_WORKER_LOG_FILE = 'logs/api.{pid}.log'
+
+logger = logging.getLogger('api')
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # 로깅 설정: import 시점이 아니라 서버 프로세스(워커)가 시작할 때 한 번 설정
+    setup_logging(API_LOG_FILE)
+    yield
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+
+# 배치 요청 1회당 최대 문장 수 / 한 번에 처리하는 문장 수
+MAX_BATCH_SIZE = 100_000
+BATCH_CHUNK_SIZE = 1_000
 
 class TextInput(BaseModel):
     text: str
 
+class BatchTextInput(BaseModel):
+    texts: List[str] = Field(..., max_length=MAX_BATCH_SIZE)
+
+class NDJSONStreamingResponse(StreamingResponse):
+    """
+    요청 본문을 읽는 동안 응답을 보내는 NDJSON 스트리밍 응답
+    StreamingResponse는 ASGI spec 2.4 미만에서 receive()로 연결 종료를 감시하는데,
+    이 경우 아직 읽지 않은 요청 본문 메시지를 가로채므로 감시 없이 바로 전송한다.
+    연결이 끊기면 요청 본문을 읽는 쪽(request.stream)에서 ClientDisconnect가 발생한다.
+    """
+    media_type = "application/x-ndjson"
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+def transform_text(text: str) -> str:
+    # 예시: 입력된 문자열을 대문자로 변환
+    return text.upper()
+
 @app.get("/")
 async def root():
     return {"message": "Hello World"}
 
 @app.post("/process")
 async def process_text(input: TextInput):
-    # 예시: 입력된 문자열을 대문자로 변환
-    result = input.text.upper()
+    result = transform_text(input.text)
     return {"result": result}
 
+@app.post("/process/batch")
+async def process_batch(input: BatchTextInput):
+    # 큰 배치는 BATCH_CHUNK_SIZE 단위로 나눠 처리: 청크 사이에 이벤트 루프를 양보해 다른 요청이 멈추지 않음
+    results: List[str] = []
+    for start in range(0, len(input.texts), BATCH_CHUNK_SIZE):
+        results.extend(map(transform_text, input.texts[start:start + BATCH_CHUNK_SIZE]))
+        await asyncio.sleep(0)
+    # 결과는 문자열 리스트이므로 jsonable_encoder 변환 없이 바로 직렬화
+    return JSONResponse({"results": results})
+
+async def iter_ndjson_chunks(request: Request) -> AsyncIterator[List[bytes]]:
+    """요청 본문을 받은 조각 단위로 읽어, 조각마다 완성된 줄 목록을 반환 (마지막 미완성 줄은 다음 조각과 합침)"""
+    buffer = bytearray()
+    async for chunk in request.stream():
+        buffer += chunk
+        end = buffer.rfind(b"\n")
+        if end < 0:
+            continue
+        lines = bytes(buffer[:end]).split(b"\n")
+        del buffer[:end + 1]
+        yield lines
+    if buffer.strip():
+        yield [bytes(buffer)]
+
+async def process_ndjson(request: Request) -> AsyncIterator[bytes]:
+    line_no = 0
+    async for lines in iter_ndjson_chunks(request):
+        output = []
+        for line in lines:
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                item = {"result": transform_text(TextInput.model_validate_json(line).text)}
+            except ValidationError as e:
+                item = {"line": line_no, "error": e.errors(include_url=False, include_input=False)}
+            output.append(json.dumps(item, ensure_ascii=False))
+        if output:
+            # 받은 조각 하나의 결과를 한 번에 전송
+            yield ("\n".join(output) + "\n").encode("utf-8")
+
+@app.post("/process/stream")
+async def process_stream(request: Request):
+    # NDJSON 요청 본문을 줄 단위로 읽으면서 결과를 NDJSON으로 바로 반환: 메모리 사용량이 본문 크기와 무관
+    return NDJSONStreamingResponse(process_ndjson(request))
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+def parse_server_args(argv: List[str] = None) -> argparse.Namespace:
+    """서버 실행 옵션: CLI 인자가 없으면 환경 변수(API_*), 그것도 없으면 기본값 사용"""
+    env = os.environ.get
+    parser = argparse.ArgumentParser(description="FastAPI 서버 실행")
+    parser.add_argument("--host", default=env("API_HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(env("API_PORT", "8000")))
+    parser.add_argument("--prod", action="store_true", default=env("API_MODE") == "prod",
+                        help="운영 모드: 멀티 워커, uvloop/httptools 사용 (API_MODE=prod)")
+    parser.add_argument("--workers", type=int, default=int(env("API_WORKERS", str(os.cpu_count() or 1))),
+                        help="운영 모드 워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--keep-alive", type=int, default=int(env("API_KEEP_ALIVE", "5")),
+                        help="keep-alive 연결 유지 시간(초)")
+    parser.add_argument("--backlog", type=int, default=int(env("API_BACKLOG", "2048")),
+                        help="대기 연결 큐 최대 길이")
+    parser.add_argument("--graceful-timeout", type=int, default=int(env("API_GRACEFUL_TIMEOUT", "30")),
+                        help="종료 신호 후 처리 중인 요청을 기다리는 시간(초)")
+    return parser.parse_args(argv)
+
+def run_server(args: argparse.Namespace) -> None:
+    if args.prod:
+        # 워커는 환경 변수를 물려받으므로 LOG_FILE의 {pid}가 워커마다 다른 파일이 됨 (LOG_FILE을 직접 지정하면 그대로 사용)
+        os.environ.setdefault("LOG_FILE", API_WORKER_LOG_FILE)
+    setup_logging(API_LOG_FILE)
+    logger.info(f'서버 시작: {args.host}:{args.port} (prod={args.prod}, workers={args.workers if args.prod else 1})')
+    if not args.prod:
+        # 개발 모드: 기존과 동일한 단일 프로세스 실행
+        uvicorn.run(app, host=args.host, port=args.port)
+        return
+
+    # 운영 모드: 워커 여러 개는 import 문자열로 전달해야 각 프로세스가 앱을 로드함
+    uvicorn.run(
+        "api:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop="uvloop" if _has_module("uvloop") else "asyncio",
+        http="httptools" if _has_module("httptools") else "h11",
+        timeout_keep_alive=args.keep_alive,
+        backlog=args.backlog,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        access_log=False, # 요청마다 로그를 쓰지 않음
+    )
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    run_server(parse_server_args())
@@ -1,15 +1,36 @@
 # app/main.py
 # 1. Module import
 import os
-import pandas as pd
-import requests
+import time
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import logging
-from typing import List, Tuple
-from preprocess import ChatPreprocessor
-from core import generate_summary
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from conversation_cache import ConversationCache, process_conversation_cached
+from assets import inject_css
+from chat_render import render_chat_window
+from prefetch import PendingTurn, TurnPrefetcher
+from result_store import TurnResult, TurnResultStore, last_customer_message, make_turn_key
+from conversation_analytics import ConversationAnalytics, render_dashboard
+from transcript_ingest import DEFAULT_TRANSCRIPT_DIR, LazyTranscript, ensure_loaded, open_transcript, resolve_transcript_path
+from logging_setup import setup_logging
+from perf import record, render_perf_panel, session_perf, stage_timer
+# pandas, requests, preprocess, core는 처음 사용할 때 import: 첫 화면이 import를 기다리지 않음
+if TYPE_CHECKING:
+    import pandas as pd
+    from preprocess import ChatPreprocessor
+    from intent_client import IntentClient
+    from result_cache import ResultCache
 
 
+# 요약 결과 표 항목
+SUMMARY_KEYS = ["Intent 당 평균 응답속도", "총 응답속도", "상품명", "Intent", "Request", "Utterance", "요약", "고객문제", "고객요청", "고객불만", "상담사응대"]
+# 대화 입력 방식
+INPUT_MODES = ["직접 입력", "파일 업로드", "서버 경로"]
+# 백그라운드 요청 결과 확인 주기(초)
+SUMMARY_POLL_INTERVAL = 0.3
+
 ########################################################
 # 2. Define functions
 ########################################################
@@ -21,83 +42,325 @@ def init_session_state():
         st.session_state.convert_summary = True
     if "processed_conversation" not in st.session_state: # str: 전처리된 대화 내용
         st.session_state.processed_conversation = ""
-    if "split_speaker_sentence" not in st.session_state: # List[Tuple[utterance_id, sentence, speaker]]: 대화 순서, 화자, 문장으로 구분된 대화 내용
+    if "split_speaker_sentence" not in st.session_state: # CompactConversation[Tuple[utterance_id, sentence, speaker]]: 대화 순서, 화자, 문장으로 구분된 대화 내용
         st.session_state.split_speaker_sentence = []
     if "chat_index" not in st.session_state: # int: 채팅 인덱스
         st.session_state.chat_index = 0
     if "current_message" not in st.session_state: # Tuple[int, str, str]: 현재 메시지
         st.session_state.current_message = None
+    if "pending_turns" not in st.session_state: # Dict[(utterance_id, 문장 해시), PendingTurn]: 진행 중인 인텐트/요약 요청
+        st.session_state.pending_turns = {}
+    if "turn_results" not in st.session_state: # TurnResultStore: 발화별 인텐트/요약 결과
+        st.session_state.turn_results = TurnResultStore()
+    if "conversation_analytics" not in st.session_state: # ConversationAnalytics: 대화 분석 대시보드용 발화별 누적 결과
+        st.session_state.conversation_analytics = ConversationAnalytics()
+
+# 요약 전 빈 표: 처음 필요할 때 한 번만 생성
+@lru_cache(maxsize=1)
+def empty_summary_table() -> "pd.DataFrame":
+    import pandas as pd
+    return pd.DataFrame({"항목": SUMMARY_KEYS, "값": [""] * len(SUMMARY_KEYS)})
+
+# 전처리 객체 생성: 프로세스당 한 번만 생성 (대화를 처음 전처리할 때)
+@st.cache_resource
+def get_preprocessor() -> "ChatPreprocessor":
+    from preprocess import ChatPreprocessor
+    return ChatPreprocessor()
+
+# 전처리 결과 캐시: 모든 세션이 공유
+@st.cache_resource
+def get_conversation_cache() -> ConversationCache:
+    return ConversationCache(max_entries=32)
+
+# 인텐트 분류 API 클라이언트: 연결 풀과 응답 캐시를 모든 세션이 공유
+@st.cache_resource
+def get_intent_client() -> "IntentClient":
+    from intent_client import IntentClient
+    return IntentClient()
+
+# 인텐트/요약 결과 디스크 캐시: 모든 세션과 서버 재시작 후에도 공유 (모델별로 구분)
+@st.cache_resource
+def get_result_cache(model_name: str) -> "ResultCache":
+    from result_cache import ResultCache
+    return ResultCache(model_name=model_name)
+
+# 인텐트/요약 백그라운드 실행기: 모든 세션이 공유
+@st.cache_resource
+def get_prefetcher(model_name: str) -> TurnPrefetcher:
+    from core import generate_summary
+    return TurnPrefetcher(get_intent_client(), generate_summary, result_cache=get_result_cache(model_name))
+
+# fragment만 다시 실행 중인지 여부 (전체 실행이면 False)
+def is_fragment_rerun() -> bool:
+    ctx = get_script_run_ctx()
+    return ctx is not None and bool(ctx.fragment_ids_this_run)
 
 # 채팅 UI 생성: 전체 대화 내용을 출력
 def chat_ui_total(messages: List[Tuple[int, str, str]]) -> None:
     chat_content = st.container(height=450)
     chat_area = chat_content.container()
     with chat_area:
-        for message in messages:
-            _, sentence, speaker = message
-            if speaker == '상담사':
-                _, col_agent = st.columns([1, 5])
-                with col_agent:
-                    st.markdown(f"""
-                                <div style='text-align: right; 
-                                background-color: rgb(250,226,213); 
-                                padding: 10px; border-radius: 10px; 
-                                width: fit-content; margin-left: auto; margin-bottom: 10px;'>
-                                <strong>상담사</strong><br>{sentence}</div>""", unsafe_allow_html=True)
-            else:
-                col_user, _ = st.columns([5, 1])
-                with col_user:
-                    st.markdown(f"""
-                                <div style='text-align: left; 
-                                background-color: rgb(226,232,240); 
-                                padding: 10px; border-radius: 10px; 
-                                width: fit-content; margin-right: auto; margin-bottom: 10px;'>
-                                <strong>고객</strong><br>{sentence}</div>""", unsafe_allow_html=True)
+        render_chat_window(messages, len(messages), key="chat_total")
 
 # 채팅 UI 생성: 대화 순서대로 출력
 def chat_ui_sequential(messages: List[Tuple[int, str, str]]) -> None:
     chat_content = st.container(height=450)
     chat_area = chat_content.container()
 
-    # 누적 출력
+    # 누적 출력: 마지막 CHAT_WINDOW_SIZE개만 한 번에 렌더링
     with chat_area:
-        for i in range(st.session_state.chat_index + 1):
-            if i < len(messages):
-                message = messages[i]
-                idx, sentence, speaker = message
-                if speaker == '상담사':
-                    _, col_agent = st.columns([1, 5])
-                    with col_agent:
-                        st.markdown(f"""
-                            <div style='text-align: right; background-color: rgb(250,226,213); 
-                            padding: 10px; border-radius: 10px; width: fit-content; 
-                            margin-left: auto; margin-bottom: 10px;'>
-                            <strong>상담사</strong><br>{sentence}</div>""", unsafe_allow_html=True)
-                else:
-                    col_user, _ = st.columns([5, 1])
-                    with col_user:
-                        st.markdown(f"""
-                            <div style='text-align: left; background-color: rgb(226,232,240); 
-                            padding: 10px; border-radius: 10px; width: fit-content; 
-                            margin-right: auto; margin-bottom: 10px;'>
-                            <strong>고객</strong><br>{sentence}</div>""", unsafe_allow_html=True)
-
-    # 다음 버튼 눌렸을 때 인덱스 증가
-    if next_button:
-        if st.session_state.chat_index < len(messages) - 1:
-            st.session_state.chat_index += 1
-            st.session_state.current_message = messages[st.session_state.chat_index]
+        end = min(st.session_state.chat_index + 1, len(messages))
+        render_chat_window(messages, end, key="chat_sequential")
             
-# 키워드 강조 함수
-def highlight_keywords(text: str, keywords: list[str]) -> str:
-    """
-    키워드를 굵은 빨간색으로 강조한 HTML 반환
-    """
-    for keyword in sorted(keywords, key=len, reverse=True):  # 긴 키워드부터 처리
-        escaped_keyword = keyword.replace(" ", "&nbsp;")  # 공백 포함 시 처리
-        styled_keyword = f'<b><span style="color:red;">{escaped_keyword}</span></b>'
-        text = text.replace(keyword, styled_keyword)
-    return text
+# 완료된 요청의 결과를 세션 결과 저장소에 저장 (실패하면 실패를 기록하고 None)
+def finish_turn(message: Tuple[int, str, str], turn: PendingTurn) -> Optional[TurnResult]:
+    st.session_state.pending_turns.pop(make_turn_key(message), None)
+    try:
+        intent_data, summary = turn.result()
+    except Exception as e:
+        # 실패한 발화는 "다시 시도"를 누르기 전까지 다시 요청하지 않음
+        logging.error(f"[ERROR] 인텐트/요약 요청 실패: {e}")
+        st.session_state.turn_results.mark_failed(message, str(e))
+        return None
+
+    # 측정한 응답 시간을 세션 측정값에 반영
+    store = session_perf()
+    if store is not None:
+        for stage, seconds in turn.timings.items():
+            store.record(stage, seconds)
+    result = TurnResult(
+        utterance_id=message[0],
+        intent_data=intent_data,
+        summary=summary,
+        intent_elapsed=turn.timings.get("intent_request"),
+        total_elapsed=turn.total_elapsed(),
+    )
+    st.session_state.turn_results.put(message, result)
+    return result
+
+# 고객 발화의 인텐트/요약 결과 가져오기: 기다리지 않고 확인만 함
+# 끝나지 않았으면 안내만 표시 (summary_result_polling_fragment가 SUMMARY_POLL_INTERVAL마다 다시 확인)
+def collect_turn_result(message: Tuple[int, str, str]) -> Optional[TurnResult]:
+    turn = prefetcher.request(st.session_state.pending_turns, message)
+    if not turn.done():
+        st.info("분석 중...")
+        return None
+    return finish_turn(message, turn)
+
+# 대시보드에 아직 반영되지 않은 고객 발화: 끝난 요청은 결과를 저장하고, 요청이 없으면 다시 요청 (실패한 발화 제외)
+def harvest_turn_results(waiting: List[Tuple[int, str, str]]) -> None:
+    pending = st.session_state.pending_turns
+    results = st.session_state.turn_results
+    for message in waiting:
+        if results.failure(message) is not None:
+            continue
+        turn = prefetcher.request(pending, message)
+        if turn.done():
+            finish_turn(message, turn)
+
+# 요약 결과 영역: 요약 표 또는 대화 분석 대시보드
+def summary_result_panel() -> None:
+    dashboard_mode = st.toggle("대화 분석 대시보드", key="dashboard_mode")
+    values = [""] * len(SUMMARY_KEYS)
+    if st.session_state.current_message is not None:
+        messages = st.session_state.split_speaker_sentence
+        index = st.session_state.chat_index
+        results = st.session_state.turn_results
+        # 다음 고객 발화 미리 요청
+        prefetcher.prefetch(st.session_state.pending_turns, messages, index, results)
+
+        # 상담사 발화일 때는 마지막 고객 발화의 결과를 표시
+        target = last_customer_message(messages, index)
+        if target is not None:
+            result = results.get(target)
+            if result is None and results.failure(target) is None:
+                result = collect_turn_result(target)
+            failure = results.failure(target) if result is None else None
+            if failure is not None:
+                st.error(f"인텐트/요약 요청 실패: {failure}")
+                if st.button("다시 시도", key="retry_turn_button"):
+                    results.clear_failure(target)
+                    st.rerun() # 결과를 기다리는 동안 요약 결과 영역을 주기적으로 다시 실행하도록 전체 실행
+            if result is not None:
+                perf_store = session_perf()
+                intent_mean = perf_store.mean("intent_request") if perf_store is not None else None
+                values[0] = f"{intent_mean:.3f}초" if intent_mean is not None else ""
+                values[1] = f"{result.total_elapsed:.3f}초" if result.total_elapsed is not None else ""
+                values[3] = result.intent
+                values[4] = result.request
+                values[6] = result.summary
+
+        # 대시보드를 볼 때만 지금까지 나온 발화를 대시보드 표에 추가 (새 발화만 append, 켜면 그동안의 발화를 한 번에 추가)
+        if dashboard_mode:
+            analytics = st.session_state.conversation_analytics
+            waiting = analytics.sync(messages, index, results)
+            if waiting:
+                harvest_turn_results(waiting)
+                analytics.sync(messages, index, results)
+
+    if dashboard_mode:
+        render_dashboard(st.session_state.conversation_analytics)
+        return
+    import pandas as pd
+    st.write("요약 결과")
+    df = pd.DataFrame({"항목": SUMMARY_KEYS, "값": values})
+    st.dataframe(df, height=450, hide_index=True, use_container_width=True)
+
+# 결과를 기다리는 동안의 요약 결과 영역: 결과가 나오거나 요청이 실패하면 전체를 다시 실행
+# (conversation_area가 summary_result_pending()을 다시 확인해 주기적으로 실행하지 않는 fragment로 바꿈)
+def summary_result_polling_panel() -> None:
+    summary_result_panel()
+    if not summary_result_pending():
+        st.rerun()
+
+# 요약 결과 영역 fragment: 결과를 기다리는 중이면 SUMMARY_POLL_INTERVAL마다 다시 실행
+summary_result_fragment = st.fragment(summary_result_panel)
+summary_result_polling_fragment = st.fragment(summary_result_polling_panel, run_every=SUMMARY_POLL_INTERVAL)
+
+# 표시할 고객 발화의 결과를 기다리는 중인지 여부 (요청이 실패한 발화는 기다리지 않음)
+def summary_result_pending() -> bool:
+    if st.session_state.current_message is None:
+        return False
+    target = last_customer_message(st.session_state.split_speaker_sentence, st.session_state.chat_index)
+    results = st.session_state.turn_results
+    return target is not None and results.get(target) is None and results.failure(target) is None
+
+# 파일 입력 상태 표시: 파일 이름과 지금까지 읽은 발화 수
+def transcript_label(transcript: LazyTranscript) -> str:
+    state = "끝까지 읽음" if transcript.exhausted else "읽는 중"
+    return f"{os.path.basename(transcript.name)}: 발화 {len(transcript)}개 ({state})"
+
+# 파일 업로드 / 서버 경로 입력: 새 파일이면 LazyTranscript로 바꾸고 처음부터 표시
+def transcript_file_input(input_mode: str) -> None:
+    if input_mode == "파일 업로드":
+        uploaded = st.file_uploader("대화 파일", type=["txt"], key="transcript_upload")
+        if uploaded is None:
+            return
+        source, name = uploaded.getbuffer(), uploaded.name # 업로드 파일은 이미 메모리에 있으므로 버퍼를 그대로 사용
+        source_id = ("upload", uploaded.file_id)
+    else:
+        path = st.text_input(
+            "서버 경로", key="transcript_path", placeholder=f"{DEFAULT_TRANSCRIPT_DIR} 아래 파일 경로")
+        if not path:
+            return
+        try:
+            source = name = resolve_transcript_path(path)
+        except (ValueError, FileNotFoundError) as e:
+            st.error(str(e))
+            return
+        source_id = ("path", source, os.path.getmtime(source))
+
+    if st.session_state.get("transcript_source_id") == source_id:
+        st.caption(transcript_label(st.session_state.split_speaker_sentence))
+        return
+
+    # 새 파일: 이전 파일 매핑을 닫고 앞쪽 몇 개 발화만 읽음
+    previous = st.session_state.split_speaker_sentence
+    if isinstance(previous, LazyTranscript):
+        previous.close()
+    transcript = open_transcript(source, name)
+    ensure_loaded(transcript, 0)
+    st.session_state.transcript_source_id = source_id
+    st.session_state.split_speaker_sentence = transcript
+    st.session_state.processed_conversation = ""
+    st.session_state.chat_index = 0
+    st.session_state.current_message = None
+    st.session_state.conversation_analytics.clear()
+    st.caption(transcript_label(transcript))
+    if is_fragment_rerun():
+        st.rerun() # 전처리된 대화(footer)도 갱신
+
+# 채팅 + 요약 영역: 다음 버튼, 대화 입력은 이 영역만 다시 실행
+@st.fragment
+def conversation_area() -> None:
+    with stage_timer("conversation_fragment"):
+        chat_col, summary_col = st.columns([4, 3])
+        with chat_col:
+            st.subheader("고객 상담 채팅")
+
+            # 채팅창 영역 empty placeholder 생성
+            chat_placeholder = st.empty()
+
+            # 버튼 동작: 요약하기는 화면 구성이 바뀌므로 전체 다시 실행
+            if st.button("요약하기", key="summarize_button"):
+                st.session_state.convert_text_to_chat = not st.session_state.convert_text_to_chat
+                st.session_state.convert_summary = not st.session_state.convert_summary
+                st.rerun()
+
+            # 다음 채팅 출력하는 버튼 생성: 이 영역(채팅 + 요약)만 다시 실행
+            if st.button("다음", key="next_button", disabled=st.session_state.convert_text_to_chat):
+                messages = st.session_state.split_speaker_sentence
+                ensure_loaded(messages, st.session_state.chat_index + 1) # 파일 입력: 다음 발화 이후 몇 개까지만 읽음
+                if st.session_state.chat_index < len(messages) - 1:
+                    st.session_state.chat_index += 1
+                    st.session_state.current_message = messages[st.session_state.chat_index]
+
+            # 조건에 따라 placeholder에 다른 요소를 렌더링
+            if st.session_state.convert_text_to_chat:
+                with chat_placeholder.container():
+                    input_mode = st.radio(
+                        "입력 방식", INPUT_MODES, horizontal=True, key="input_mode", label_visibility="collapsed")
+                    if input_mode != INPUT_MODES[0]:
+                        transcript_file_input(input_mode) # 파일은 전처리 없이 발화 단위로 필요한 만큼만 읽음
+                    else:
+                        conversation = st.text_area(
+                            label="conversation_text",
+                            height=450,
+                            key="conversation_text",
+                            placeholder="상담사, 고객으로 구분된 대화 내용을 입력하세요",
+                            label_visibility="collapsed")
+                        if conversation: # 대화 내용이 있는 경우, 전처리 후 session_state 업데이트
+                            with stage_timer("process_conversation"):
+                                processed_conversation, split_speaker_sentence = process_conversation_cached(
+                                    conversation_cache, get_preprocessor(), conversation)
+                            previous = st.session_state.split_speaker_sentence
+                            if split_speaker_sentence is not previous:
+                                st.session_state.conversation_analytics.clear() # 다른 대화: 대시보드 초기화
+                                if isinstance(previous, LazyTranscript):
+                                    # 파일 입력을 대체: 같은 파일을 다시 고르면 새로 읽도록 파일 표시를 지움
+                                    previous.close()
+                                    st.session_state.pop("transcript_source_id", None)
+                            changed = processed_conversation != st.session_state.processed_conversation
+                            st.session_state.processed_conversation = processed_conversation
+                            st.session_state.split_speaker_sentence = split_speaker_sentence
+                            if changed and is_fragment_rerun():
+                                st.rerun() # 전처리된 대화(footer)도 갱신
+            else:
+                with chat_placeholder:
+                    messages = st.session_state.split_speaker_sentence
+                    # chat_ui_total(messages) # 전체 대화 내용을 출력
+                    with stage_timer("render_chat"):
+                        chat_ui_sequential(messages) # 대화 순서대로 출력
+
+        with summary_col:
+            st.subheader("요약 결과")
+
+            # 요약 결과 영역 empty placeholder 생성
+            summary_placeholder = st.empty()
+
+            if st.session_state.convert_summary:
+                # markdown_table = generate_markdown_item_value_table(items)
+                # st.markdown(markdown_table)
+                st.dataframe(empty_summary_table(), height=450, hide_index=True, use_container_width=True)
+            else:
+                with summary_placeholder.container():
+                    # 인텐트/요약 결과를 기다리는 동안 UI를 막지 않음
+                    if summary_result_pending():
+                        summary_result_polling_fragment()
+                    else:
+                        summary_result_fragment()
+
+# 전처리된 대화 영역: 전체 실행 때만 다시 그림
+@st.fragment
+def footer_area() -> None:
+    # 전처리된 대화 표시 (더 보기 좋게)
+    st.subheader("전처리된 대화")
+    if st.session_state.processed_conversation:
+        st.markdown("```\n" + st.session_state.processed_conversation + "\n```")
+    elif isinstance(st.session_state.split_speaker_sentence, LazyTranscript):
+        st.write("파일 입력은 전처리 없이 발화 단위로 읽습니다.")
+    else:
+        st.write("전처리된 대화가 없습니다.")
 
 # Markdown 테이블을 생성: 일단 보류(너비 유지 불가)
 def generate_markdown_item_value_table(items: list) -> str:
@@ -120,6 +383,9 @@ def generate_markdown_item_value_table(items: list) -> str:
 # 3. Main
 ########################################################
 # 3.1. 페이지 설정
+# 스크립트 실행(rerun) 시간 측정 시작
+rerun_started = time.perf_counter()
+
 # Web title 설정: Model name 표시
 try:
     # llm_model_name = os.getenv("LLM_MODEL")
@@ -136,15 +402,14 @@ st.set_page_config(
     layout="wide" # 더 많은 공간 최적화를 위한 CSS
 )
 
-# 로깅 설정
-logging.basicConfig(
-    filename='./logs/streamlit_app.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# 말풍선 CSS 삽입: 프로세스당 한 번 읽고 압축, 파일이 바뀌면 다시 읽음
+inject_css('assets/css/chat.css')
+
+# 로깅 설정: 프로세스당 한 번만 설정, 파일 쓰기는 별도 스레드에서 수행
+setup_logging('logs/streamlit_app.log')
 
-# 전처리 객체 생성
-preprocessor = ChatPreprocessor()
+# 전처리 결과 캐시 (전처리 객체는 대화를 처음 전처리할 때 생성)
+conversation_cache = get_conversation_cache()
 
 # 초기 세션 상태 설정
 init_session_state()
@@ -164,10 +429,16 @@ footer_container = st.container()
 with header_container:
     st.title("Chatting Demo")
 
+# 인텐트/요약 백그라운드 실행기 (인텐트 분류 API 클라이언트, 결과 캐시 포함): 제목을 먼저 보낸 뒤 준비
+prefetcher = get_prefetcher(llm_model_name)
+
 # 3.3.2. Sidebar 영역 내용 생성
 with sidebar_container:
     st.markdown("#### 디버깅 정보")
     st.write(st.session_state.current_message)
+    st.caption(f"전처리 캐시: {conversation_cache.stats()}")
+    st.caption(f"결과 캐시: {prefetcher.result_cache.stats()}")
+    render_perf_panel() # 단계별 지연 시간 (이전 실행까지의 측정값)
     # st.subheader("전처리된 대화")
     # if st.session_state.processed_conversation:
     #     st.markdown(st.session_state.processed_conversation)
@@ -176,77 +447,11 @@ with sidebar_container:
     
 # 3.3.3. Main 영역 내용 생성
 with main_container:
-    chat_col, summary_col = st.columns([4, 3])
-    with chat_col:
-        st.subheader("고객 상담 채팅")
-
-        # 채팅창 영역 empty placeholder 생성
-        chat_placeholder = st.empty()
-
-        # 버튼 동작
-        if st.button("요약하기"):
-            st.session_state.convert_text_to_chat = not st.session_state.convert_text_to_chat
-            st.session_state.convert_summary = not st.session_state.convert_summary
-
-        # 다음 채팅 출력하는 버튼 생성
-        next_button = st.button("다음", key="next_button", disabled=st.session_state.convert_text_to_chat)
-
-        # 조건에 따라 placeholder에 다른 요소를 렌더링
-        if st.session_state.convert_text_to_chat:
-            with chat_placeholder:
-                conversation = st.text_area(
-                    label="conversation_text",
-                    height=450,
-                    key="conversation_text",
-                    placeholder="상담사, 고객으로 구분된 대화 내용을 입력하세요",
-                    label_visibility="collapsed")
-                if conversation: # 대화 내용이 있는 경우, 전처리 후 session_state 업데이트
-                    processed_conversation, split_speaker_sentence = preprocessor.process_conversation(conversation)
-                    st.session_state.processed_conversation = processed_conversation
-                    st.session_state.split_speaker_sentence = split_speaker_sentence
-        else:
-            with chat_placeholder:
-                messages = st.session_state.split_speaker_sentence
-                # chat_ui_total(messages) # 전체 대화 내용을 출력
-                chat_ui_sequential(messages) # 대화 순서대로 출력
-
-    with summary_col:
-        st.subheader("요약 결과")
-
-        # 요약 결과 영역 empty placeholder 생성
-        summary_placeholder = st.empty()
-        
-        if st.session_state.convert_summary:
-            keys = ["Intent 당 평균 응답속도", "총 응답속도", "상품명", "Intent", " Request", "Utterance", "요약", "고객문제", "고객요청", "고객불만", "상담사응대"]
-            values = ["", "", "", "", "", "", "", "", "", "", ""]
-            # markdown_table = generate_markdown_item_value_table(items)
-            # st.markdown(markdown_table)
-            df = pd.DataFrame({"항목": keys, "값": values})
-            st.dataframe(df, height=450, hide_index=True, use_container_width=True)
-        else:
-            with summary_placeholder:
-                if st.session_state.current_message[2] == "고객":
-                    query = st.session_state.current_message[2] + ") " + st.session_state.current_message[1]
-                    api_url = "http://192.168.0.90:43307/llm_intent_select2"
-                    response = requests.post(api_url, json={"query": query})
-                    meta_data = response.json()["selected_intent_data"]
-                    intent_response_time = response.json()["intent_response_time"]
-                    intent = response.json()["Intent"]
-                    request = response.json()["Request"]
-                    summary = generate_summary(query, {})
-
-                st.write("요약 결과")
-                keys = ["Intent 당 평균 응답속도", "총 응답속도", "상품명", "Intent", "Request", "Utterance", "요약", "고객문제", "고객요청", "고객불만", "상담사응대"]
-                values = [intent_response_time, "", "", intent, request, "", summary, "", "", "", ""]
-                df = pd.DataFrame({"항목": keys, "값": values})
-                st.dataframe(df, height=450, hide_index=True, use_container_width=True)
+    conversation_area()
 
 # 3.3.4. Footer 영역 내용 생성
 with footer_container:
-    # 전처리된 대화 표시 (더 보기 좋게)
-        st.subheader("전처리된 대화")
-        if st.session_state.processed_conversation:
-            st.markdown("```\n" + st.session_state.processed_conversation + "\n```")
-        else:
-            st.write("전처리된 대화가 없습니다.")
+    footer_area()
 
+# 스크립트 실행(rerun) 시간 기록
+record("rerun", time.perf_counter() - rerun_started)
@@ -0,0 +1,52 @@
+import os
+import re
+import threading
+from typing import Dict, Tuple
+
+import streamlit as st
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 경로별 (수정 시각, 압축된 CSS): 프로세스 전체에서 공유
+_css_cache: Dict[str, Tuple[float, str]] = {}
+_lock = threading.Lock()
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_SPACE_RE = re.compile(r"\s*([{}:;,>])\s*")
+
+
+def minify_css(css: str) -> str:
+    """주석과 불필요한 공백을 제거한 CSS 반환"""
+    css = _COMMENT_RE.sub("", css)
+    css = _SPACE_RE.sub(" ", css)
+    css = _PUNCT_SPACE_RE.sub(r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def load_css(path: str) -> str:
+    """
+    CSS 파일을 읽어 압축한 결과 반환
+    - 프로세스당 한 번만 읽고, 파일 수정 시각(mtime)이 바뀌면 다시 읽음 (개발 중 수정 반영)
+    """
+    full_path = path if os.path.isabs(path) else os.path.join(ROOT_DIR, path)
+    mtime = os.stat(full_path).st_mtime
+    with _lock:
+        cached = _css_cache.get(full_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+    with open(full_path, encoding='utf-8') as f:
+        css = minify_css(f.read())
+    with _lock:
+        _css_cache[full_path] = (mtime, css)
+    return css
+
+
+def inject_css(*paths: str) -> None:
+    """
+    CSS 파일들을 하나의 <style> 블록으로 페이지에 삽입
+    Streamlit은 rerun에서 다시 그리지 않은 요소를 지우므로 매 실행마다 호출해야 하지만,
+    파일 읽기/압축은 load_css 캐시를 사용하므로 실행마다 stat 호출 비용만 듦
+    """
+    css = "".join(load_css(path) for path in paths)
+    st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
@@ -0,0 +1,366 @@
+"""
+대화 전문 일괄 처리 CLI: app.py와 같은 전처리 → 인텐트 분류 → 요약 과정을 화면 없이 실행
+
+- 입력: 대화 전문 파일(*.txt)이 있는 디렉터리 또는 JSONL 파일 ({"id": ..., "text": ...})
+- 전처리(ChatPreprocessor.process_conversation)는 프로세스 풀에서 실행
+- 인텐트 분류 / 요약 요청은 동시 요청 수를 제한해 스레드 풀에서 실행
+- 결과는 JSONL(대화 1건 = 1줄) 또는 Parquet(발화 1건 = 1행, 파트 파일)로 저장
+- 이미 저장된 대화는 건너뛰므로 중단 후 같은 명령으로 이어서 실행 가능
+  - 인텐트/요약 요청이 실패한 발화가 있는 대화는 결과를 기록하되 완료로 표시하지 않음: 다음 실행 때 다시 처리
+  - 같은 대화 id의 결과가 여러 번 기록되어 있으면 마지막 결과가 최신
+
+실행:
+    python batch_cli.py calls/ -o results.jsonl
+    python batch_cli.py calls.jsonl -o results_parquet --format parquet --http-concurrency 16
+    python batch_cli.py calls.jsonl -o results.jsonl --no-summary --parse-workers 4
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from intent_client import DEFAULT_INTENT_API_URL, IntentClient
+from logging_setup import setup_logging
+from message_store import CompactConversation
+from prefetch import make_query
+
+logger = logging.getLogger('batch_cli')
+
+# 전처리 워커 프로세스마다 한 번 생성
+_preprocessor = None
+
+
+def _init_parse_worker() -> None:
+    global _preprocessor
+    from preprocess import ChatPreprocessor
+    _preprocessor = ChatPreprocessor()
+
+
+def parse_transcript(text: str) -> Tuple[str, CompactConversation]:
+    """워커 프로세스에서 전처리 (결과는 CompactConversation으로 변환해 프로세스 간 전송량을 줄임)"""
+    processed_conversation, split_speaker_sentence = _preprocessor.process_conversation(text)
+    return processed_conversation, CompactConversation(split_speaker_sentence)
+
+
+def iter_transcripts(path: str, id_field: str = "id", text_field: str = "text") -> Iterator[Tuple[str, str]]:
+    """(대화 id, 대화 전문)을 하나씩 반환: 전체 입력을 메모리에 올리지 않음"""
+    if os.path.isdir(path):
+        for file_path in sorted(glob.glob(os.path.join(path, "**", "*.txt"), recursive=True)):
+            with open(file_path, encoding="utf-8") as f:
+                yield os.path.relpath(file_path, path), f.read()
+        return
+
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield str(record.get(id_field, line_no)), record[text_field]
+
+
+def has_errors(record: Dict[str, Any]) -> bool:
+    """인텐트/요약 요청이 실패한 발화가 있는 대화인지 여부 (완료로 표시하지 않고 다음 실행 때 다시 처리)"""
+    return any(turn.get("error") for turn in record["turns"])
+
+
+def truncate_partial_line(path: str, chunk_size: int = 64 * 1024) -> None:
+    """중단되며 잘린 마지막 줄을 잘라 냄: 이어서 쓰는 줄이 잘린 줄에 붙지 않도록 마지막 줄바꿈 뒤를 삭제"""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - chunk_size)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b"\n")
+            if newline >= 0:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            f.truncate(position)
+
+
+class JsonlOutput:
+    """대화 1건을 JSON 한 줄로 저장: 한 줄 쓸 때마다 flush하므로 각 줄이 체크포인트"""
+
+    def __init__(self, path: str):
+        self.path = path
+        truncate_partial_line(path)
+        self._file = open(path, "a", encoding="utf-8")
+
+    @staticmethod
+    def done_ids(path: str) -> Set[str]:
+        """완료된 대화 id: 같은 id가 여러 줄이면 마지막 줄 기준 (실패한 발화가 있으면 완료가 아님)"""
+        done: Set[str] = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        transcript_id = record["id"]
+                        failed = has_errors(record)
+                    except (ValueError, KeyError):
+                        continue # 중단되며 잘린 마지막 줄
+                    if failed:
+                        done.discard(transcript_id)
+                    else:
+                        done.add(transcript_id)
+        return done
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetOutput:
+    """
+    발화 1건을 1행으로 디렉터리에 Parquet 파트 파일로 저장
+    - rows_per_part행마다 part-XXXXX.parquet을 쓰고, 포함된 대화 id를 _done_ids.txt에 기록
+    - 대화 하나는 항상 같은 파트에 들어가므로 _done_ids.txt에 있는 대화는 완전히 저장된 것
+    - 실패한 발화가 있는 대화는 행은 쓰지만 _done_ids.txt에 기록하지 않음 (다시 처리하면 뒤쪽 파트에 최신 결과)
+    """
+
+    def __init__(self, path: str, rows_per_part: int = 50_000):
+        import pandas as pd # Parquet 출력일 때만 필요 (pyarrow 필요)
+        self._pd = pd
+        self.path = path
+        self.rows_per_part = rows_per_part
+        os.makedirs(path, exist_ok=True)
+        self._rows: List[Dict[str, Any]] = []
+        self._ids: List[str] = []
+        self._part = len(glob.glob(os.path.join(path, "part-*.parquet")))
+
+    @staticmethod
+    def done_ids(path: str) -> Set[str]:
+        checkpoint = os.path.join(path, "_done_ids.txt")
+        if not os.path.exists(checkpoint):
+            return set()
+        with open(checkpoint, encoding="utf-8") as f:
+            return {line.rstrip("\n") for line in f if line.strip()}
+
+    def write(self, record: Dict[str, Any]) -> None:
+        for turn in record["turns"]:
+            self._rows.append({"id": record["id"], **turn})
+        if not has_errors(record):
+            self._ids.append(record["id"])
+        if len(self._rows) >= self.rows_per_part:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._rows and not self._ids:
+            return
+        frame = self._pd.DataFrame(self._rows)
+        if "intent_data" in frame:
+            frame["intent_data"] = frame["intent_data"].map(
+                lambda value: None if value is None else json.dumps(value, ensure_ascii=False))
+        frame.to_parquet(os.path.join(self.path, f"part-{self._part:05d}.parquet"), index=False)
+        with open(os.path.join(self.path, "_done_ids.txt"), "a", encoding="utf-8") as f:
+            f.writelines(f"{transcript_id}\n" for transcript_id in self._ids)
+        self._part += 1
+        self._rows, self._ids = [], []
+
+    def close(self) -> None:
+        self.flush()
+
+
+@dataclass
+class PendingTranscript:
+    """처리 중인 대화: 전처리 결과를 기다리는 중이면 turns가 None"""
+    transcript_id: str
+    parse_future: Future
+    turns: Optional[List[Tuple[Tuple[int, str, str], Optional[Future], Optional[Future]]]] = None
+    error: Optional[str] = None # 전처리 실패 사유
+    started_at: float = field(default_factory=time.perf_counter)
+
+    def done(self) -> bool:
+        if self.error is not None:
+            return True
+        return self.turns is not None and all(
+            future is None or future.done() for _, intent, summary in self.turns for future in (intent, summary))
+
+
+def _future_value(future: Optional[Future]) -> Tuple[Any, Optional[str]]:
+    if future is None:
+        return None, None
+    try:
+        return future.result(), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def build_record(pending: PendingTranscript, processed_conversation: str) -> Dict[str, Any]:
+    turns = []
+    for (utterance_id, sentence, speaker), intent_future, summary_future in pending.turns:
+        intent_data, intent_error = _future_value(intent_future)
+        summary, summary_error = _future_value(summary_future)
+        turns.append({
+            "utterance_id": utterance_id,
+            "speaker": speaker,
+            "sentence": sentence,
+            "intent": intent_data.get("Intent") if intent_data else None,
+            "request": intent_data.get("Request") if intent_data else None,
+            "intent_response_time": intent_data.get("intent_response_time") if intent_data else None,
+            "intent_data": intent_data.get("selected_intent_data") if intent_data else None,
+            "summary": summary,
+            "error": intent_error or summary_error,
+        })
+    return {
+        "id": pending.transcript_id,
+        "processed_conversation": processed_conversation,
+        "turns": turns,
+        "elapsed_sec": round(time.perf_counter() - pending.started_at, 3),
+    }
+
+
+def run(
+    transcripts: Iterator[Tuple[str, str]],
+    output,
+    done_ids: Set[str],
+    intent_client: IntentClient,
+    summarize: Optional[Callable[[str, dict], Any]],
+    parse_workers: int,
+    http_concurrency: int,
+    max_in_flight: int,
+) -> Dict[str, int]:
+    """
+    대화를 순서대로 처리해 output에 기록
+    - 동시에 처리 중인 대화는 max_in_flight개로 제한 (메모리 사용량 제한)
+    - 결과는 입력 순서대로 기록
+    """
+    stats = {"written": 0, "skipped": 0, "failed": 0, "retry": 0}
+    queue: Deque[PendingTranscript] = deque()
+
+    with ProcessPoolExecutor(max_workers=parse_workers, initializer=_init_parse_worker) as parse_pool, \
+            ThreadPoolExecutor(max_workers=http_concurrency, thread_name_prefix="batch-http") as http_pool:
+
+        def submit_turns(pending: PendingTranscript) -> None:
+            """전처리가 끝난 대화의 고객 발화마다 인텐트/요약 요청 (전처리가 안 끝났으면 대기)"""
+            try:
+                _, messages = pending.parse_future.result()
+            except Exception as e:
+                pending.error = f"{type(e).__name__}: {e}"
+                logger.error(f'[ERROR] 전처리 실패 ({pending.transcript_id}): {pending.error}')
+                return
+            turns = []
+            for message in messages:
+                intent_future = summary_future = None
+                if message[2] == "고객":
+                    query = make_query(message)
+                    intent_future = http_pool.submit(intent_client.select_intent, query)
+                    if summarize is not None:
+                        summary_future = http_pool.submit(summarize, query, {})
+                turns.append((message, intent_future, summary_future))
+            pending.turns = turns
+
+        def submit_ready_turns() -> None:
+            for pending in queue:
+                if pending.turns is None and pending.error is None and pending.parse_future.done():
+                    submit_turns(pending)
+
+        def write_head() -> None:
+            """가장 먼저 들어온 대화가 끝날 때까지 기다렸다가 기록"""
+            pending = queue.popleft()
+            if pending.turns is None and pending.error is None:
+                submit_turns(pending)
+            if pending.error is not None:
+                stats["failed"] += 1
+                return
+            for _, intent_future, summary_future in pending.turns:
+                for future in (intent_future, summary_future):
+                    if future is not None:
+                        future.exception() # 완료될 때까지 대기 (예외는 build_record에서 기록)
+            processed_conversation, _ = pending.parse_future.result()
+            record = build_record(pending, processed_conversation)
+            output.write(record)
+            stats["written"] += 1
+            if has_errors(record):
+                stats["retry"] += 1
+            if stats["written"] % 100 == 0:
+                logger.info(f'{stats["written"]}건 저장')
+
+        for transcript_id, text in transcripts:
+            if transcript_id in done_ids:
+                stats["skipped"] += 1
+                continue
+            queue.append(PendingTranscript(transcript_id, parse_pool.submit(parse_transcript, text)))
+            submit_ready_turns()
+            while queue and queue[0].done():
+                write_head()
+            if len(queue) >= max_in_flight:
+                write_head()
+
+        while queue:
+            submit_ready_turns()
+            write_head()
+
+    return stats
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="대화 전문 일괄 처리 (전처리 → 인텐트 분류 → 요약)")
+    parser.add_argument("input", help="*.txt 대화 파일 디렉터리 또는 JSONL 파일")
+    parser.add_argument("-o", "--output", required=True, help="결과 JSONL 파일 또는 Parquet 디렉터리")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--id-field", default="id", help="JSONL 입력의 대화 id 필드")
+    parser.add_argument("--text-field", default="text", help="JSONL 입력의 대화 전문 필드")
+    parser.add_argument("--parse-workers", type=int, default=os.cpu_count() or 1, help="전처리 프로세스 수")
+    parser.add_argument("--http-concurrency", type=int, default=8, help="인텐트/요약 동시 요청 수")
+    parser.add_argument("--max-in-flight", type=int, default=64, help="동시에 처리 중인 대화 수")
+    parser.add_argument("--rows-per-part", type=int, default=50_000, help="Parquet 파트 파일당 행 수")
+    parser.add_argument("--intent-url", help="인텐트 분류 API 주소 (기본: INTENT_API_URL)")
+    parser.add_argument("--no-summary", action="store_true", help="요약(generate_summary) 생략")
+    args = parser.parse_args(argv)
+
+    setup_logging('logs/batch_cli.log')
+
+    if args.format == "parquet":
+        done_ids = ParquetOutput.done_ids(args.output)
+        output = ParquetOutput(args.output, args.rows_per_part)
+    else:
+        done_ids = JsonlOutput.done_ids(args.output)
+        output = JsonlOutput(args.output)
+
+    summarize = None
+    if not args.no_summary:
+        from core import generate_summary
+        summarize = generate_summary
+
+    intent_client = IntentClient(api_url=args.intent_url or DEFAULT_INTENT_API_URL, pool_size=args.http_concurrency)
+
+    started = time.perf_counter()
+    try:
+        stats = run(
+            iter_transcripts(args.input, args.id_field, args.text_field),
+            output,
+            done_ids,
+            intent_client,
+            summarize,
+            args.parse_workers,
+            args.http_concurrency,
+            args.max_in_flight,
+        )
+    finally:
+        output.close()
+        intent_client.close()
+
+    elapsed = time.perf_counter() - started
+    message = (f'완료: 저장 {stats["written"]}건 (요청 실패 포함 {stats["retry"]}건: 다음 실행 때 재시도), '
+               f'건너뜀 {stats["skipped"]}건, 실패 {stats["failed"]}건 ({elapsed:.1f}초)')
+    logger.info(message)
+    print(message, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
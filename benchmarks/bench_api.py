@@ -0,0 +1,249 @@
+"""
+FastAPI 서버(api.py) 부하/지연 시간 벤치마크
+
+- 서버를 직접 띄우고(in-process 스레드 또는 `python api.py` 서브프로세스) 각 엔드포인트에 동시 요청
+- 시나리오별 처리량(req/s)과 p50/p95/p99 지연 시간을 출력하고 JSON 파일로 저장
+- 결과 파일은 benchmarks/results/ 에 쌓이므로 실행 간 비교 가능
+
+실행:
+    python benchmarks/bench_api.py                               # 기본: 서브프로세스(개발 모드)
+    python benchmarks/bench_api.py --server prod --workers 4      # 운영 모드 서버
+    python benchmarks/bench_api.py --url http://10.0.0.5:8000     # 이미 떠 있는 서버
+    python benchmarks/bench_api.py --concurrency 1,16 --sizes tiny,1m --requests 100
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+from urllib.parse import urlparse
+
+from common import ROOT, write_report
+
+# 페이로드 크기: 짧은 문자열 ~ 1MB 대화 전문
+PAYLOAD_SIZES = {
+    "tiny": 16,
+    "1k": 1024,
+    "64k": 64 * 1024,
+    "1m": 1024 * 1024,
+}
+BATCH_ITEM_SIZE = 64 # 배치/스트림 시나리오에서 문장 하나의 길이
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str
+    body: bytes = b""
+    content_type: str = "application/json"
+    items: int = 1 # 요청 하나에 들어 있는 문장 수
+
+
+def make_text(size: int) -> str:
+    base = "고객) 배송이 아직 안 왔어요. hello world "
+    return (base * (size // len(base.encode("utf-8")) + 1)).encode("utf-8")[:size].decode("utf-8", "ignore")
+
+
+def build_scenarios(sizes: List[str], batch_size: int) -> List[Scenario]:
+    scenarios = [Scenario("GET /", "GET", "/")]
+    for size in sizes:
+        body = json.dumps({"text": make_text(PAYLOAD_SIZES[size])}, ensure_ascii=False).encode("utf-8")
+        scenarios.append(Scenario(f"POST /process [{size}]", "POST", "/process", body))
+
+    texts = [make_text(BATCH_ITEM_SIZE)] * batch_size
+    batch_body = json.dumps({"texts": texts}, ensure_ascii=False).encode("utf-8")
+    scenarios.append(Scenario(f"POST /process/batch [{batch_size}]", "POST", "/process/batch", batch_body, items=batch_size))
+
+    line = json.dumps({"text": texts[0]}, ensure_ascii=False)
+    stream_body = ("\n".join([line] * batch_size) + "\n").encode("utf-8")
+    scenarios.append(Scenario(f"POST /process/stream [{batch_size}]", "POST", "/process/stream", stream_body,
+                              content_type="application/x-ndjson", items=batch_size))
+    return scenarios
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+def run_scenario(host: str, port: int, scenario: Scenario, concurrency: int, total_requests: int) -> Dict:
+    """keep-alive 연결 concurrency개로 total_requests개 요청을 보내고 지연 시간을 측정"""
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    counter = iter(range(total_requests))
+    headers = {"Content-Type": scenario.content_type} if scenario.body else {}
+
+    def worker():
+        nonlocal errors
+        conn = http.client.HTTPConnection(host, port, timeout=60)
+        local: List[float] = []
+        local_errors = 0
+        while True:
+            with lock:
+                if next(counter, None) is None:
+                    break
+            started = time.perf_counter()
+            try:
+                conn.request(scenario.method, scenario.path, scenario.body or None, headers)
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    local_errors += 1
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=60)
+                continue
+            local.append(time.perf_counter() - started)
+        conn.close()
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "scenario": scenario.name,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "request_bytes": len(scenario.body),
+        "elapsed_sec": round(elapsed, 4),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "items_per_sec": round(len(latencies) * scenario.items / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p95": round(percentile(latencies, 95) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+        },
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_ready(host: str, port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            conn.request("GET", "/")
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"서버가 {timeout}초 안에 시작되지 않았습니다: {host}:{port}")
+
+
+def start_server(mode: str, port: int, workers: int) -> Callable[[], None]:
+    """서버를 시작하고, 서버를 종료하는 함수를 반환"""
+    if mode == "inprocess":
+        import uvicorn
+        from api import app
+
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        wait_until_ready("127.0.0.1", port)
+
+        def stop():
+            server.should_exit = True
+            thread.join(timeout=10)
+        return stop
+
+    command = [sys.executable, os.path.join(ROOT, "api.py"), "--host", "127.0.0.1", "--port", str(port)]
+    if mode == "prod":
+        command += ["--prod", "--workers", str(workers)]
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready("127.0.0.1", port)
+    except RuntimeError:
+        process.kill()
+        raise
+
+    def stop():
+        process.terminate()
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return stop
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="api.py 부하/지연 시간 벤치마크")
+    parser.add_argument("--server", choices=["inprocess", "dev", "prod"], default="dev",
+                        help="inprocess: 같은 프로세스의 스레드, dev: python api.py, prod: python api.py --prod")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="prod 모드 워커 수")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소 (지정하면 서버를 띄우지 않음)")
+    parser.add_argument("--concurrency", default="1,8,32", help="동시 연결 수 목록 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=500, help="시나리오당 요청 수 (1m 페이로드는 1/10)")
+    parser.add_argument("--sizes", default=",".join(PAYLOAD_SIZES), help=f"페이로드 크기 ({', '.join(PAYLOAD_SIZES)})")
+    parser.add_argument("--batch-size", type=int, default=1000, help="batch/stream 요청 하나의 문장 수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: benchmarks/results/api-<시각>.json)")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in PAYLOAD_SIZES]
+    if unknown:
+        parser.error(f"알 수 없는 페이로드 크기: {unknown}")
+    concurrency_levels = [int(value) for value in args.concurrency.split(",")]
+
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+        stop = lambda: None
+    else:
+        host, port = "127.0.0.1", free_port()
+        stop = start_server(args.server, port, args.workers)
+
+    results = []
+    try:
+        for scenario in build_scenarios(sizes, args.batch_size):
+            total = args.requests // 10 if len(scenario.body) >= PAYLOAD_SIZES["1m"] else args.requests
+            for concurrency in concurrency_levels:
+                result = run_scenario(host, port, scenario, concurrency, max(total, concurrency))
+                results.append(result)
+                latency = result["latency_ms"]
+                print(f"{result['scenario']:<32} c={concurrency:<4} {result['throughput_rps']:>10.1f} req/s  "
+                      f"p50={latency['p50']:.2f}ms p95={latency['p95']:.2f}ms p99={latency['p99']:.2f}ms  "
+                      f"errors={result['errors']}")
+    finally:
+        stop()
+
+    config = {
+        "server": "external" if args.url else args.server,
+        "url": args.url,
+        "workers": args.workers if args.server == "prod" and not args.url else 1,
+        "requests": args.requests,
+        "concurrency": concurrency_levels,
+        "sizes": sizes,
+        "batch_size": args.batch_size,
+    }
+    output = write_report("api", config, results, args.output)
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Streamlit 전체 실행 vs fragment 실행 벤치마크 (main.py / app.py, "Next" 버튼)
+
+- 전체 실행: 브라우저가 fragment 밖 위젯을 눌렀을 때처럼 스크립트 전체를 다시 실행
+- fragment 실행: "Next" 버튼이 있는 conversation_area fragment만 다시 실행
+- 대화 길이(발화 수)별로 실행 시간과 브라우저로 보내는 메시지(ForwardMsg) 크기를 측정
+- streamlit.testing의 AppTest를 사용하므로 브라우저 / 서버 없이 실행 가능
+  (AppTest는 항상 전체 실행만 하므로 내부 LocalScriptRunner를 교체해 fragment 실행을 요청함)
+- app.py는 인텐트 분류 API로 stub_server를 같은 프로세스에서 띄워 사용
+  - --delay로 응답을 늦추면 결과를 기다리는 중(요약 결과 영역 "분석 중...")에 "Next"를 누르는 경우를 측정
+  - 실행 중 예외가 나면 오류 (예: 중첩된 요약 결과 fragment가 fragment 실행 중에 st.rerun을 요청)
+  - pending: 클릭 후 결과를 아직 기다리고 있던 비율
+
+실행:
+    python benchmarks/bench_fragments.py --sizes 100,1000,10000 --clicks 20
+    python benchmarks/bench_fragments.py --script app.py --delay 2 --sizes 100 --extra-path /path/to/preprocess_and_core
+"""
+import argparse
+import os
+import statistics
+import time
+from typing import Dict, List, Optional
+
+from common import ROOT, format_conversation, make_messages, streamlit_bench_env, write_report
+from message_store import CompactConversation
+
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData, ScriptRequests
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import app_test as app_test_module
+from streamlit.testing.v1.element_tree import parse_tree_from_messages
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner, require_widgets_deltas
+
+# 결과를 기다리는 동안 요약 결과 영역에 표시되는 안내 (app.py)
+PENDING_TEXT = "분석 중..."
+
+
+class MeasuringScriptRunner(LocalScriptRunner):
+    """
+    LocalScriptRunner + fragment 실행 / 메시지 크기 측정
+    fragment_id가 설정되어 있으면 브라우저처럼 해당 fragment만 다시 실행하도록 요청
+    """
+    fragment_id: Optional[str] = None
+    last_bytes = 0
+    last_messages = 0
+    last_fragment_ids: Dict[str, str] = {} # 위젯 id -> fragment id (마지막 실행 기준)
+
+    def run(self, widget_state=None, query_params=None, timeout=3, page_hash=""):
+        cls = MeasuringScriptRunner
+        fragment_queue = [cls.fragment_id] if cls.fragment_id else []
+        if fragment_queue:
+            # 생성자가 넣어 둔 전체 실행 요청과 합쳐지지 않도록 요청 큐를 새로 만듦
+            self._requests = ScriptRequests()
+        self.request_rerun(RerunData(
+            widget_states=widget_state, page_script_hash=page_hash, fragment_id_queue=fragment_queue))
+        try:
+            if not self._script_thread:
+                self.start()
+            require_widgets_deltas(self, timeout)
+        finally:
+            self.join()
+
+        messages = self.forward_msgs()
+        cls.last_messages = len(messages)
+        cls.last_bytes = sum(message.ByteSize() for message in messages)
+        cls.last_fragment_ids = {}
+        for message in messages:
+            element = message.delta.new_element
+            if message.HasField("delta") and element.WhichOneof("type") == "button" and message.delta.fragment_id:
+                cls.last_fragment_ids[element.button.id] = message.delta.fragment_id
+        return parse_tree_from_messages(messages)
+
+
+def prepare_app(script: str, turns: int, timeout: float, tag: str = "") -> AppTest:
+    """대화를 넣고 Summarize를 눌러 채팅 화면까지 진행한 AppTest"""
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=timeout)
+    at.run()
+    messages = CompactConversation(make_messages(turns, tag)) # 화면과 같은 저장 형식
+    at.session_state["split_speaker_sentence"] = messages
+    at.session_state["processed_conversation"] = format_conversation(messages)
+    at.button(key="summarize_button").click().run()
+    return at
+
+
+def click_next(at: AppTest, fragment_id: Optional[str]) -> Dict[str, float]:
+    MeasuringScriptRunner.fragment_id = fragment_id
+    try:
+        started = time.perf_counter()
+        at.button(key="next_button").click().run()
+        elapsed = time.perf_counter() - started
+    finally:
+        MeasuringScriptRunner.fragment_id = None
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    pending = any(info.value == PENDING_TEXT for info in at.info)
+    return {"ms": elapsed * 1000, "bytes": MeasuringScriptRunner.last_bytes,
+            "messages": MeasuringScriptRunner.last_messages, "pending": pending}
+
+
+def next_button_fragment(at: AppTest) -> str:
+    for widget_id, fragment_id in MeasuringScriptRunner.last_fragment_ids.items():
+        if "next_button" in widget_id:
+            return fragment_id
+    raise RuntimeError("Next 버튼이 fragment 안에 없습니다")
+
+
+def bench(script: str, turns: int, clicks: int, timeout: float) -> List[Dict]:
+    results = []
+    for mode in ("full", "fragment"):
+        at = prepare_app(script, turns, timeout, tag=f"{mode}-{turns}-")
+        fragment_id = next_button_fragment(at) if mode == "fragment" else None
+        samples = [click_next(at, fragment_id) for _ in range(clicks)]
+        times = sorted(sample["ms"] for sample in samples)
+        results.append({
+            "script": script,
+            "mode": mode,
+            "turns": turns,
+            "clicks": clicks,
+            "mean_ms": round(statistics.mean(times), 2),
+            "p50_ms": round(times[len(times) // 2], 2),
+            "p95_ms": round(times[int(0.95 * (len(times) - 1))], 2),
+            "delta_bytes": round(statistics.mean(sample["bytes"] for sample in samples)),
+            "delta_messages": round(statistics.mean(sample["messages"] for sample in samples), 1),
+            "pending": round(statistics.mean(sample["pending"] for sample in samples), 2),
+        })
+    return results
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Streamlit 전체 실행 vs fragment 실행 벤치마크")
+    parser.add_argument("--sizes", default="100,1000,10000", help="대화 발화 수 목록 (쉼표 구분)")
+    parser.add_argument("--clicks", type=int, default=20, help="대화 길이별 Next 클릭 횟수")
+    parser.add_argument("--timeout", type=float, default=30.0, help="스크립트 실행 timeout(초)")
+    parser.add_argument("--script", default="main.py", help="실행할 스크립트 (저장소 루트 기준)")
+    parser.add_argument("--delay", type=float, default=0.0, help="stub 인텐트 분류 API 응답 지연(초, app.py)")
+    parser.add_argument("--extra-path", action="append", default=[], help="sys.path에 추가할 경로 (preprocess, core 등)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: benchmarks/results/fragments-<시각>.json)")
+    args = parser.parse_args(argv)
+
+    app_test_module.LocalScriptRunner = MeasuringScriptRunner # AppTest가 측정용 runner를 사용하도록 교체
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = []
+    with streamlit_bench_env("bench_fragments", args.extra_path, delay=args.delay):
+        for turns in sizes:
+            for result in bench(args.script, turns, args.clicks, args.timeout):
+                results.append(result)
+                print(f"{result['mode']:<9} turns={turns:<7} mean={result['mean_ms']:>8.2f} ms  "
+                      f"p95={result['p95_ms']:>8.2f} ms  delta={result['delta_bytes'] / 1024:>9.1f} KiB "
+                      f"({result['delta_messages']} msgs)  pending={result['pending']:.0%}")
+    config = {"sizes": sizes, "clicks": args.clicks, "script": args.script, "delay": args.delay}
+    output = write_report("fragments", config, results, args.output)
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
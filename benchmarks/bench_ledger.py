@@ -0,0 +1,156 @@
+"""
+급여 장부(ledger.py) 벤치마크: 여러 해 / 여러 직원 장부
+
+- income.md와 같은 형식(천 단위 쉼표, '-', *합계* 강조)의 장부를 연도별 표로 생성
+  - 행: 직원 x 연도 x 12개월, 일부 행은 기록된 합계를 일부러 틀리게 씀 (--errors)
+- 단계별 측정
+  - parse: Markdown -> 타입이 지정된 DataFrame (load_ledger 첫 호출, 파일 읽기 포함)
+  - cached: 같은 파일로 load_ledger 다시 호출 (mtime 캐시)
+  - totals: 지급총액 / 공제총액 / 차인지급액 계산 (벡터 연산)
+  - check: 일관성 검사
+  - loop_totals: 비교용, 행마다 문자열을 숫자로 바꿔 Python으로 합계 계산
+- 일관성 검사가 찾은 합계 불일치 수가 --errors와 다르면 오류
+
+실행:
+    python benchmarks/bench_ledger.py --employees 10,100,1000 --years 5
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+from common import write_report
+from ledger import GROSS_PAY, NET_PAY, TOTAL_DEDUCTION, iter_markdown_tables, load_ledger
+
+PAYMENT_ITEMS = ("기본급", "식대", "연장급여수당")
+DEDUCTION_ITEMS = ("국민연금", "건강보험", "고용보험", "장기요양보험료", "소득세", "지방소득세")
+FIRST_YEAR = 2020
+
+
+def amount(value: int) -> str:
+    return f"{value:,}" if value else "-"
+
+
+def make_ledger_text(employees: int, years: int, errors: int, seed: int = 0) -> str:
+    """직원 x 연도 x 12개월 장부 (연도별 수입 / 공제금 표), errors개 행은 지급총액을 1원 틀리게 기록"""
+    rng = random.Random(seed)
+    rows = employees * years * 12
+    wrong = set(rng.sample(range(rows), min(errors, rows)))
+    payment_header = ["직원", "구분", *PAYMENT_ITEMS, f"*{GROSS_PAY}*", f"**{NET_PAY}**"]
+    deduction_header = ["직원", "구분", *DEDUCTION_ITEMS, f"*{TOTAL_DEDUCTION}*"]
+    payments: Dict[int, List[str]] = {}
+    deductions: Dict[int, List[str]] = {}
+    row = 0
+    for year in range(FIRST_YEAR, FIRST_YEAR + years):
+        for employee in range(employees):
+            for month in range(1, 13):
+                pay = [rng.randint(1_500_000, 4_000_000), 200_000, rng.choice((0, rng.randint(50_000, 500_000)))]
+                deduction = [rng.choice((0, rng.randint(10_000, 200_000))) for _ in DEDUCTION_ITEMS]
+                gross, total_deduction = sum(pay), sum(deduction)
+                recorded_gross = gross + 1 if row in wrong else gross
+                key = [f"직원{employee:04d}", f"{year}-{month:02d}"]
+                payments.setdefault(year, []).append("|" + "|".join(
+                    key + [amount(v) for v in pay] + [f"*{recorded_gross:,}*", f"**{gross - total_deduction:,}**"]) + "|")
+                deductions.setdefault(year, []).append("|" + "|".join(
+                    key + [amount(v) for v in deduction] + [f"*{total_deduction:,}*"]) + "|")
+                row += 1
+
+    lines = ["# 급여 장부"]
+    for year in payments:
+        for title, header, body in ((f"{year} 수입", payment_header, payments[year]),
+                                    (f"{year} 공제금", deduction_header, deductions[year])):
+            lines += [f"## {title}", "|" + "|".join(header) + "|", "|" + "|".join([":-:"] * len(header)) + "|", *body, ""]
+    return "\n".join(lines)
+
+
+def loop_totals(text: str) -> Dict[Tuple[str, ...], List[int]]:
+    """비교용: 행마다 Python으로 숫자 변환 후 합계 (키 -> [지급총액, 공제총액])"""
+    totals: Dict[Tuple[str, ...], List[int]] = {}
+    for section, header, body in iter_markdown_tables(text):
+        slot = 0 if "수입" in section else 1
+        for line in body.splitlines():
+            row = [cell.strip().strip("*") for cell in line.split("|")]
+            key = tuple(row[:2])
+            value = sum(int(cell.replace(",", "")) for name, cell in zip(header[2:], row[2:])
+                        if cell not in ("-", "") and name not in (GROSS_PAY, TOTAL_DEDUCTION, NET_PAY))
+            totals.setdefault(key, [0, 0])[slot] += value
+    return totals
+
+
+def timed(func: Callable, repeat: int) -> Tuple[float, object]:
+    """func()를 repeat번 실행한 시간(ms) 중앙값과 마지막 결과"""
+    times, result = [], None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        times.append((time.perf_counter() - started) * 1000)
+    return statistics.median(times), result
+
+
+def bench(employees: int, years: int, errors: int, repeat: int) -> Dict:
+    text = make_ledger_text(employees, years, errors)
+    with tempfile.TemporaryDirectory(prefix="bench_ledger-") as directory:
+        path = os.path.join(directory, "income.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+        def parse():
+            os.utime(path, ns=(time.time_ns(), time.time_ns())) # mtime을 바꿔 캐시를 무효화
+            return load_ledger(path)
+
+        parse_ms, ledger = timed(parse, repeat)
+        cached_ms, cached = timed(lambda: load_ledger(path), repeat)
+        if cached is not ledger:
+            raise RuntimeError("mtime이 같은데 장부를 다시 읽었습니다")
+    totals_ms, totals = timed(lambda: ledger._compute_totals(), repeat)
+    ledger._totals = totals
+    check_ms, issues = timed(lambda: ledger._check(), repeat)
+    loop_ms, _ = timed(lambda: loop_totals(text), repeat)
+
+    mismatches = int((issues["검사"] == "합계 불일치").sum()) if not issues.empty else 0
+    if mismatches != min(errors, len(totals)):
+        raise RuntimeError(f"합계 불일치 {errors}건 중 {mismatches}건만 찾았습니다")
+    return {
+        "employees": employees,
+        "years": years,
+        "rows": len(totals),
+        "file_kib": round(len(text.encode("utf-8")) / 1024, 1),
+        "parse_ms": round(parse_ms, 2),
+        "cached_ms": round(cached_ms, 4),
+        "totals_ms": round(totals_ms, 2),
+        "check_ms": round(check_ms, 2),
+        "loop_totals_ms": round(loop_ms, 2),
+        "issues": len(issues),
+        "memory_kib": round((ledger.payments.memory_usage(deep=True).sum()
+                             + ledger.deductions.memory_usage(deep=True).sum()) / 1024, 1),
+    }
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="급여 장부 파싱 / 합계 / 검사 벤치마크")
+    parser.add_argument("--employees", default="10,100,1000", help="직원 수 목록 (쉼표 구분)")
+    parser.add_argument("--years", type=int, default=5, help="연도 수 (연도마다 12개월)")
+    parser.add_argument("--errors", type=int, default=10, help="기록된 합계를 틀리게 쓸 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: benchmarks/results/ledger-<시각>.json)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.employees.split(",")]
+    results = []
+    for employees in sizes:
+        result = bench(employees, args.years, args.errors, args.repeat)
+        results.append(result)
+        print(f"employees={employees:<6} rows={result['rows']:<7} file={result['file_kib']:>8.1f} KiB  "
+              f"parse={result['parse_ms']:>8.2f} ms  cached={result['cached_ms']:.4f} ms  "
+              f"totals={result['totals_ms']:>7.2f} ms  check={result['check_ms']:>7.2f} ms  "
+              f"loop_totals={result['loop_totals_ms']:>8.2f} ms  issues={result['issues']}")
+    config = {"employees": sizes, "years": args.years, "errors": args.errors, "repeat": args.repeat}
+    output = write_report("ledger", config, results, args.output)
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
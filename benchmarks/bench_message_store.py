@@ -0,0 +1,104 @@
+"""
+대화 저장 방식별 메모리 사용량 벤치마크
+
+- split_speaker_sentence: list[tuple] vs CompactConversation
+- chat_history: list[dict](기존 코드, 중복 확인은 전체 순회) / list[dict] + set 인덱스 vs ChatHistory (CompactConversation + 해시 인덱스)
+- tracemalloc으로 컨테이너를 만든 뒤 남아 있는 메모리(문장 문자열 포함)를 측정
+
+실행:
+    python benchmarks/bench_message_store.py --sizes 1000,10000,100000
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Set, Tuple
+
+from common import write_report
+from chat_history import ChatHistory
+from message_store import CompactConversation
+
+SENTENCES = [
+    "안녕하세요 쿠팡 고객센터입니다 무엇을 도와드릴까요",
+    "주문한 상품이 아직 배송되지 않았어요",
+    "확인해 보니 내일 도착 예정입니다",
+    "환불 요청하려면 어떻게 해야 하나요",
+    "네 고객님 마이쿠팡에서 반품 신청하실 수 있습니다",
+]
+
+
+def iter_messages(count: int, seed: int = 0) -> Iterator[Tuple[int, str, str]]:
+    """전처리 결과처럼 메시지마다 새 문장 문자열을 만들어 하나씩 반환"""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield i, f"{rng.choice(SENTENCES)} {i}", "고객" if i % 2 == 0 else "상담사"
+
+
+def legacy_chat_history(count: int) -> Tuple[List[Dict[str, str]], Set[Tuple[str, str]]]:
+    """이전 방식: list[dict] + (role, content) tuple 집합 인덱스"""
+    history: List[Dict[str, str]] = []
+    index: Set[Tuple[str, str]] = set()
+    for _, sentence, speaker in iter_messages(count):
+        history.append({"role": speaker, "content": sentence})
+        index.add((speaker, sentence))
+    return history, index
+
+
+def measure(build: Callable[[], object]) -> Tuple[int, float]:
+    """build()가 새로 할당한 메모리(바이트)와 걸린 시간(초)"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    container = build()
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current, elapsed
+
+
+def bench(count: int) -> List[Dict]:
+    # 각 방식이 문장 문자열까지 포함해 최종적으로 붙잡고 있는 메모리를 비교
+    cases = {
+        "split_speaker_sentence: list[tuple]": lambda: list(iter_messages(count)),
+        "split_speaker_sentence: CompactConversation": lambda: CompactConversation(iter_messages(count)),
+        "chat_history: list[dict]": lambda: [
+            {"role": speaker, "content": sentence} for _, sentence, speaker in iter_messages(count)],
+        "chat_history: list[dict] + set index": lambda: legacy_chat_history(count),
+        "chat_history: ChatHistory": lambda: ChatHistory(
+            {"role": speaker, "content": sentence} for _, sentence, speaker in iter_messages(count)),
+    }
+
+    results = []
+    for name, build in cases.items():
+        allocated, elapsed = measure(build)
+        results.append({
+            "case": name,
+            "messages": count,
+            "bytes": allocated,
+            "bytes_per_message": round(allocated / count, 1),
+            "build_ms": round(elapsed * 1000, 2),
+        })
+    return results
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="대화 저장 방식별 메모리 벤치마크")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="메시지 수 목록 (쉼표 구분)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: benchmarks/results/message_store-<시각>.json)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = []
+    for count in sizes:
+        for result in bench(count):
+            results.append(result)
+            print(f"{result['case']:<50} n={count:<8} {result['bytes'] / 1024:>10.1f} KiB "
+                  f"{result['bytes_per_message']:>8.1f} B/msg  {result['build_ms']:>8.2f} ms")
+    output = write_report("message_store", {"sizes": sizes}, results, args.output)
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Streamlit 스크립트 시작 시간 벤치마크 (cold start / warm rerun)
+
+- 새 Python 프로세스를 `-X importtime`으로 띄워 AppTest로 스크립트를 실행
+  - streamlit import: AppTest 준비 (스크립트와 무관한 공통 비용)
+  - 첫 실행(cold): 스크립트가 처음 import하는 모듈 비용 포함
+  - 첫 화면(first element): 첫 실행에서 화면 요소(delta)가 처음 브라우저로 나가기까지의 시간
+  - 이후 실행(warm): 모듈과 cache_resource가 이미 준비된 상태의 rerun
+- 첫 실행 중에 import된 모듈을 누적 시간 순으로 보고 (-X importtime 출력 분석)
+- 프로세스를 --repeat번 새로 띄워 중앙값 사용
+
+실행:
+    python benchmarks/bench_startup.py --script main.py
+    python benchmarks/bench_startup.py --script app.py --extra-path /path/to/preprocess_and_core
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+from common import ROOT, write_report
+
+# 첫 실행 직전에 stderr에 쓰는 표시: 이후의 -X importtime 줄은 스크립트가 import한 모듈
+RUN_MARKER = "--- bench_startup: script run ---"
+
+CHILD_CODE = """
+import json, os, sys, time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+imported = time.perf_counter()
+os.chdir({root!r})
+
+first_element = []
+enqueue = LocalScriptRunner._enqueue_forward_msg
+def timed_enqueue(self, msg):
+    if not first_element and msg.HasField("delta") and msg.delta.HasField("new_element"):
+        first_element.append(time.perf_counter())
+    enqueue(self, msg)
+LocalScriptRunner._enqueue_forward_msg = timed_enqueue
+at = AppTest.from_file({script!r}, default_timeout=120)
+sys.stderr.write({marker!r} + "\\n")
+sys.stderr.flush()
+cold_started = time.perf_counter()
+at.run()
+cold = time.perf_counter() - cold_started
+warm = []
+for _ in range({warm_runs}):
+    run_started = time.perf_counter()
+    at.run()
+    warm.append(time.perf_counter() - run_started)
+print(json.dumps({{
+    "streamlit_import_s": imported - started,
+    "cold_run_s": cold,
+    "first_element_s": first_element[0] - cold_started if first_element else None,
+    "warm_runs_s": warm,
+    "exceptions": [str(e.value) for e in at.exception],
+}}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """RUN_MARKER 이후의 `import time: self | cumulative | name` 줄 -> [{module, self_ms, cumulative_ms}]"""
+    _, _, after = stderr.partition(RUN_MARKER)
+    modules = []
+    for line in after.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        modules.append({
+            "module": name.rstrip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return modules
+
+
+def top_level_imports(modules: List[Dict]) -> List[Dict]:
+    """들여쓰기 없는 (스크립트가 직접 일으킨) import만, 누적 시간 순"""
+    top = [dict(m, module=m["module"].strip()) for m in modules if not m["module"].startswith("  ")]
+    return sorted(top, key=lambda m: m["cumulative_ms"], reverse=True)
+
+
+def run_once(script: str, warm_runs: int, extra_path: List[str]) -> Dict:
+    code = CHILD_CODE.format(root=ROOT, script=script, marker=RUN_MARKER, warm_runs=warm_runs)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(extra_path + [ROOT] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, env=env, check=True)
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["imports"] = top_level_imports(parse_importtime(proc.stderr))
+    return result
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Streamlit 스크립트 시작 시간 벤치마크")
+    parser.add_argument("--script", default="main.py", help="실행할 스크립트 (저장소 루트 기준)")
+    parser.add_argument("--repeat", type=int, default=5, help="새 프로세스로 반복할 횟수")
+    parser.add_argument("--warm-runs", type=int, default=5, help="프로세스마다 첫 실행 후 추가 실행 횟수")
+    parser.add_argument("--extra-path", action="append", default=[], help="PYTHONPATH에 추가할 경로 (preprocess, core 등)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 import 수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: benchmarks/results/startup-<시각>.json)")
+    args = parser.parse_args(argv)
+
+    script = os.path.join(ROOT, args.script)
+    runs = [run_once(script, args.warm_runs, args.extra_path) for _ in range(args.repeat)]
+    for run in runs:
+        if run["exceptions"]:
+            print(f"[경고] 스크립트 예외: {run['exceptions'][0][:200]}")
+
+    # 모듈별 누적 import 시간: 프로세스별 값의 중앙값
+    per_module: Dict[str, List[float]] = {}
+    for run in runs:
+        for module in run["imports"]:
+            per_module.setdefault(module["module"], []).append(module["cumulative_ms"])
+    imports = sorted(
+        ({"module": name, "cumulative_ms": round(statistics.median(values), 1)} for name, values in per_module.items()),
+        key=lambda m: m["cumulative_ms"], reverse=True)
+
+    warm = [value for run in runs for value in run["warm_runs_s"]]
+    first = [run["first_element_s"] for run in runs if run["first_element_s"] is not None]
+    summary = {
+        "script": args.script,
+        "streamlit_import_ms": round(statistics.median(r["streamlit_import_s"] for r in runs) * 1000, 1),
+        "cold_run_ms": round(statistics.median(r["cold_run_s"] for r in runs) * 1000, 1),
+        "first_element_ms": round(statistics.median(first) * 1000, 1) if first else None,
+        "warm_run_ms": round(statistics.median(warm) * 1000, 1) if warm else None,
+        "script_import_ms": round(sum(m["cumulative_ms"] for m in imports), 1),
+        "top_imports": imports[:args.top],
+    }
+    print(f"{args.script}: streamlit import {summary['streamlit_import_ms']} ms, "
+          f"cold run {summary['cold_run_ms']} ms (script imports {summary['script_import_ms']} ms, "
+          f"first element {summary['first_element_ms']} ms), "
+          f"warm run {summary['warm_run_ms']} ms")
+    for module in summary["top_imports"]:
+        print(f"  {module['cumulative_ms']:>8.1f} ms  {module['module']}")
+
+    config = {"script": args.script, "repeat": args.repeat, "warm_runs": args.warm_runs, "extra_path": args.extra_path}
+    output = write_report("startup", config, [summary], args.output)
+    print(f"결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
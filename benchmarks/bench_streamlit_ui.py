@@ -0,0 +1,177 @@
+"""
+Streamlit 화면(main.py / app.py) 대화 길이별 실행 벤치마크
+
+- AppTest로 브라우저 / Streamlit 서버 없이 스크립트를 실행
+- 대화 길이(발화 수)별로 아래 순서대로 실행하고 단계마다 측정
+  - initial: 첫 실행
+  - input: conversation_text에 합성 대화 입력 (전처리 + 발화 분리)
+  - summarize: "Summarize"(요약하기) 클릭 (채팅 화면으로 전환)
+  - next: "Next"(다음) 클릭 --clicks번
+- 측정값: 실행 시간, 실행 중 최대 메모리(tracemalloc peak), 화면 요소 수
+  - tracemalloc은 실행 시간을 몇 배로 늘리므로 같은 순서를 한 번 더 실행해 메모리만 따로 측정
+  - initial은 첫 스크립트 / 첫 대화 길이에서 모듈 import 시간을 포함
+- 인텐트 분류 API / 스트리밍 API는 stub_server를 같은 프로세스에서 띄워 사용
+- --baseline으로 이전 결과 파일과 비교해 평균 실행 시간이 --tolerance 이상 느려지면 종료 코드 1
+
+실행:
+    python benchmarks/bench_streamlit_ui.py --scripts main.py,app.py --extra-path /path/to/preprocess_and_core
+    python benchmarks/bench_streamlit_ui.py --sizes 10,1000 --baseline benchmarks/results/streamlit_ui-<시각>.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+from common import ROOT, format_conversation, make_messages, streamlit_bench_env, write_report
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import Block
+
+# 위젯 key (main.py, app.py 공통)
+SUMMARIZE_KEY = "summarize_button"
+NEXT_KEY = "next_button"
+CONVERSATION_KEY = "conversation_text"
+
+
+def count_elements(node) -> int:
+    """화면 요소(블록 제외) 수"""
+    if isinstance(node, Block):
+        return sum(count_elements(child) for child in node.children.values())
+    return 1
+
+
+def measured_run(at: AppTest, action) -> Dict[str, float]:
+    """
+    action(at) -> AppTest 실행 1번의 시간 / 요소 수
+    tracemalloc이 켜져 있으면 실행 중 최대 메모리(실행 전 대비 증가량)와 실행 후 메모리도 기록
+    """
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+    started = time.perf_counter()
+    action(at)
+    elapsed = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    sample = {"ms": elapsed * 1000, "elements": count_elements(at._tree)}
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        sample.update(peak_bytes=peak - before, heap_bytes=current)
+    return sample
+
+
+def summarize(script: str, turns: int, step: str, samples: List[Dict[str, float]], memory: List[Dict[str, float]]) -> Dict:
+    times = sorted(sample["ms"] for sample in samples)
+    return {
+        "script": script,
+        "turns": turns,
+        "step": step,
+        "runs": len(samples),
+        "mean_ms": round(statistics.mean(times), 2),
+        "p95_ms": round(times[int(0.95 * (len(times) - 1))], 2),
+        "max_ms": round(times[-1], 2),
+        "peak_mib": round(max(sample["peak_bytes"] for sample in memory) / 2**20, 2),
+        "heap_mib": round(memory[-1]["heap_bytes"] / 2**20, 2),
+        "elements": max(sample["elements"] for sample in samples),
+    }
+
+
+def run_steps(script: str, turns: int, clicks: int, timeout: float, streaming: bool) -> List[Tuple[str, List[Dict]]]:
+    """initial -> input -> summarize -> next x clicks 순서로 실행하고 [(step, samples)] 반환"""
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=timeout)
+    steps = [("initial", [measured_run(at, lambda at: at.run())])]
+    if streaming:
+        at.toggle(key="streaming_mode").set_value(True).run()
+
+    text = format_conversation(make_messages(turns, tag=f"{script}-{turns}-"))
+    steps.append(("input", [measured_run(at, lambda at: at.text_area(key=CONVERSATION_KEY).input(text).run())]))
+    steps.append(("summarize", [measured_run(at, lambda at: at.button(key=SUMMARIZE_KEY).click().run())]))
+    steps.append(("next", [measured_run(at, lambda at: at.button(key=NEXT_KEY).click().run()) for _ in range(clicks)]))
+    return steps
+
+
+def bench(script: str, turns: int, clicks: int, timeout: float, streaming: bool, repeat: int) -> List[Dict]:
+    """새 AppTest로 repeat번 실행한 시간을 단계별로 합치고, 메모리는 마지막 1번(tracemalloc)으로 측정"""
+    timed = run_steps(script, turns, clicks, timeout, streaming)
+    for _ in range(repeat - 1):
+        for (_, samples), (_, more) in zip(timed, run_steps(script, turns, clicks, timeout, streaming)):
+            samples.extend(more)
+    tracemalloc.start()
+    try:
+        traced = run_steps(script, turns, clicks, timeout, streaming)
+    finally:
+        tracemalloc.stop()
+    return [
+        summarize(script, turns, step, samples, memory)
+        for (step, samples), (_, memory) in zip(timed, traced)
+    ]
+
+
+def compare(results: List[Dict], baseline_path: str, tolerance: float) -> List[str]:
+    """baseline 결과 파일과 평균 실행 시간 비교: tolerance(비율) 이상 느려진 항목 목록 반환"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["script"], r["turns"], r["step"]): r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        before = baseline.get((result["script"], result["turns"], result["step"]))
+        if before is None or not before["mean_ms"]:
+            continue
+        ratio = result["mean_ms"] / before["mean_ms"]
+        line = (f"{result['script']:<8} turns={result['turns']:<6} {result['step']:<10} "
+                f"{before['mean_ms']:>9.2f} -> {result['mean_ms']:>9.2f} ms ({ratio:.2f}x), "
+                f"elements {before['elements']} -> {result['elements']}")
+        print(line)
+        if ratio > 1 + tolerance:
+            regressions.append(line)
+    return regressions
+
+
+def main(argv: List[str] = None) -> Optional[int]:
+    parser = argparse.ArgumentParser(description="Streamlit 화면 대화 길이별 실행 벤치마크")
+    parser.add_argument("--scripts", default="main.py,app.py", help="실행할 스크립트 목록 (쉼표 구분, 저장소 루트 기준)")
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="대화 발화 수 목록 (쉼표 구분)")
+    parser.add_argument("--clicks", type=int, default=10, help="대화 길이별 Next 클릭 횟수")
+    parser.add_argument("--repeat", type=int, default=3, help="대화 길이별로 처음부터 반복할 횟수 (시간 측정)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="스크립트 실행 timeout(초)")
+    parser.add_argument("--streaming", action="store_true", help="main.py 스트리밍 모드로 실행")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="stub 스트리밍 API 토큰 간격(초)")
+    parser.add_argument("--extra-path", action="append", default=[], help="sys.path에 추가할 경로 (preprocess, core 등)")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용하는 평균 실행 시간 증가 비율")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (기본: benchmarks/results/streamlit_ui-<시각>.json)")
+    args = parser.parse_args(argv)
+
+    scripts = args.scripts.split(",")
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = []
+    with streamlit_bench_env("bench_streamlit_ui", args.extra_path, token_delay=args.token_delay):
+        for script in scripts:
+            for turns in sizes:
+                for result in bench(script, turns, args.clicks, args.timeout, args.streaming, args.repeat):
+                    results.append(result)
+                    print(f"{script:<8} turns={turns:<6} {result['step']:<10} mean={result['mean_ms']:>9.2f} ms  "
+                          f"p95={result['p95_ms']:>9.2f} ms  peak={result['peak_mib']:>7.2f} MiB  "
+                          f"elements={result['elements']}")
+
+    config = {
+        "scripts": scripts, "sizes": sizes, "clicks": args.clicks, "repeat": args.repeat,
+        "streaming": args.streaming, "token_delay": args.token_delay,
+    }
+    output = write_report("streamlit_ui", config, results, args.output)
+    print(f"결과 저장: {output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        if regressions:
+            print(f"[경고] 평균 실행 시간이 {args.tolerance:.0%} 넘게 증가한 항목 {len(regressions)}개")
+            return 1
+    return None
+
+
+if __name__ == "__main__":
+    sys.exit(main())
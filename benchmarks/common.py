@@ -0,0 +1,120 @@
+"""벤치마크 스크립트 공통: 결과 JSON 파일 저장, 합성 대화, Streamlit 화면 벤치마크 실행 환경"""
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+# 벤치마크 대상 모듈(api.py, message_store.py ...)을 import할 수 있도록 저장소 루트 추가
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(name: str, config: Dict[str, Any], results: List[Dict[str, Any]], output: str = None) -> str:
+    """
+    결과를 JSON 파일로 저장하고 경로 반환 (기본: benchmarks/results/<name>-<시각>.json)
+    실행 간 비교를 위해 git commit, Python 버전, CPU 수를 함께 기록
+    """
+    now = datetime.now()
+    report = {
+        "benchmark": name,
+        "timestamp": now.isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": config,
+        "results": results,
+    }
+    output = output or os.path.join(RESULTS_DIR, f"{name}-{now:%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return output
+
+
+CUSTOMER_SENTENCES = ("주문한 상품이 아직 배송되지 않았어요", "환불은 언제 처리되나요", "쿠폰 적용이 안 됩니다")
+AGENT_SENTENCES = ("확인해 보겠습니다 잠시만 기다려 주세요", "불편을 드려 죄송합니다", "다른 문의 사항 있으신가요")
+
+
+def make_messages(turns: int, tag: str = "") -> List[Tuple[int, str, str]]:
+    """
+    고객 / 상담사가 번갈아 말하는 turns개 발화 [(번호, 문장, 화자)]
+    문장마다 tag와 번호를 붙여 실행마다 결과 캐시에 걸리지 않게 함
+    """
+    messages = []
+    for i in range(turns):
+        if i % 2 == 0:
+            messages.append((i, f"{CUSTOMER_SENTENCES[i // 2 % len(CUSTOMER_SENTENCES)]} {tag}{i}", "고객"))
+        else:
+            messages.append((i, f"{AGENT_SENTENCES[i // 2 % len(AGENT_SENTENCES)]} {tag}{i}", "상담사"))
+    return messages
+
+
+def format_conversation(messages: Sequence[Tuple[int, str, str]]) -> str:
+    """발화 목록 -> 화면에 입력하는 대화 전문 ("화자) 문장" 줄)"""
+    return "\n".join(f"{speaker}) {sentence}" for _, sentence, speaker in messages)
+
+
+def start_stub_server(delay: float = 0.0, token_delay: float = 0.0) -> Tuple[object, str]:
+    """stub_server를 스레드로 실행하고 (server, base url) 반환"""
+    from stub_server import make_server
+    server = make_server(host="127.0.0.1", port=0, delay=delay, token_delay=token_delay)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+@contextlib.contextmanager
+def streamlit_bench_env(
+    name: str, extra_paths: Sequence[str] = (), delay: float = 0.0, token_delay: float = 0.0
+) -> Iterator[str]:
+    """
+    Streamlit 화면 벤치마크 실행 환경 (끝나면 원래대로 되돌림)
+    - extra_paths를 sys.path 앞에 추가 (preprocess, core 등)
+    - stub_server를 띄우고 인텐트 분류 / 스트리밍 API 주소를 환경 변수로 설정
+    - 결과 캐시는 임시 디렉터리 사용 (저장소의 결과 캐시를 건드리지 않음)
+    - 저장소 루트에서 실행 (스크립트가 assets/, logs/를 상대 경로로 사용)
+    stub_server base url 반환
+    """
+    sys.path[:0] = extra_paths
+    server, base_url = start_stub_server(delay, token_delay)
+    env = {
+        "INTENT_API_URL": f"{base_url}/llm_intent_select2",
+        "LLM_STREAM_URL": f"{base_url}/llm_stream",
+    }
+    saved_env = {key: os.environ.get(key) for key in (*env, "RESULT_CACHE_PATH")}
+    saved_cwd = os.getcwd()
+    cache_dir = tempfile.TemporaryDirectory(prefix=f"{name}-")
+    try:
+        os.environ.update(env, RESULT_CACHE_PATH=os.path.join(cache_dir.name, "llm_results.sqlite3"))
+        os.chdir(ROOT)
+        yield base_url
+    finally:
+        os.chdir(saved_cwd)
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        server.shutdown()
+        cache_dir.cleanup()
+        for path in extra_paths:
+            if path in sys.path:
+                sys.path.remove(path)
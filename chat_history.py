@@ -0,0 +1,81 @@
+from typing import Dict, Iterator, List, Tuple
+
+from message_store import CompactConversation
+
+
+def normalize_role(role: str) -> str:
+    """상담사 발화의 경우 role을 '상담사'로 통일 (상담사A, 상담사1 -> 상담사)"""
+    if role.startswith('상담사'):
+        return '상담사'
+    return role
+
+
+class ChatHistory:
+    """
+    채팅 기록: 순서가 있는 메시지 목록과 (role, content) 해시 인덱스를 함께 관리
+    - 메시지는 CompactConversation에 저장 (메시지마다 dict를 두지 않음)
+    - append()할 때 인덱스도 같이 갱신되므로 중복 확인이 O(1)
+    - 인덱스 키의 role은 normalize_role()로 정규화
+    - 인덱스는 문자열을 따로 붙잡지 않도록 hash((role, content)) -> 위치만 저장하고,
+      찾으면 저장된 메시지와 비교 (해시가 겹치는 드문 경우만 (role, content) -> 위치로 따로 보관)
+    - 기존 list[dict]처럼 순회, 인덱싱, len() 사용 가능 (조회할 때 dict 생성)
+    """
+
+    def __init__(self, messages: List[Dict[str, str]] = None):
+        self._store = CompactConversation()
+        self._index: Dict[int, int] = {} # hash((정규화된 role, content)) -> 처음 나온 위치
+        self._collisions: Dict[Tuple[str, str], int] = {} # 해시가 겹친 다른 메시지 -> 처음 나온 위치
+        for message in messages or []:
+            self.append(message)
+
+    @staticmethod
+    def make_key(role: str, content: str) -> Tuple[str, str]:
+        return normalize_role(role), content.strip()
+
+    def append(self, message: Dict[str, str]) -> None:
+        position = len(self._store)
+        self._store.append((position, message["content"], message["role"]))
+        key = self.make_key(message["role"], message["content"])
+        first = self._index.setdefault(hash(key), position)
+        if first != position and self._key_at(first) != key:
+            self._collisions.setdefault(key, position)
+
+    def add_if_new(self, role: str, content: str) -> bool:
+        """같은 (role, content) 메시지가 없을 때만 추가하고, 추가 여부를 반환"""
+        if self.contains(role, content):
+            return False
+        self.append({"role": normalize_role(role), "content": content.strip()})
+        return True
+
+    def contains(self, role: str, content: str) -> bool:
+        key = self.make_key(role, content)
+        position = self._index.get(hash(key))
+        if position is None:
+            return False
+        # 해시가 같아도 실제 내용이 같은지 확인
+        return self._key_at(position) == key or key in self._collisions
+
+    def _key_at(self, position: int) -> Tuple[str, str]:
+        return self.make_key(self._store.speaker(position), self._store.sentence(position))
+
+    def clear(self) -> None:
+        self._store = CompactConversation()
+        self._index.clear()
+        self._collisions.clear()
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        role, content = key
+        return self.contains(role, content)
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        for i in range(len(self._store)):
+            yield self[i]
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        _, content, role = self._store[index]
+        return {"role": role, "content": content}
@@ -0,0 +1,64 @@
+from typing import Optional, Sequence, Tuple
+
+import streamlit as st
+
+# 한 번에 그리는 최근 말풍선 수 (이전 대화는 "이전 대화 더 보기"로 K개씩 추가)
+CHAT_WINDOW_SIZE = 50
+
+# 말풍선 스타일은 assets/css/chat.css의 클래스로 정의
+AGENT_BUBBLE = "<div class='bubble agent'><strong>상담사</strong><br>{sentence}</div>"
+CUSTOMER_BUBBLE = "<div class='bubble customer'><strong>고객</strong><br>{sentence}</div>"
+
+
+def render_bubble(sentence: str, speaker: str) -> str:
+    """메시지 하나를 말풍선 HTML로 변환"""
+    template = AGENT_BUBBLE if speaker == '상담사' else CUSTOMER_BUBBLE
+    return template.format(sentence=sentence)
+
+
+def build_chat_html(messages: Sequence[Tuple[int, str, str]], start: int, end: int) -> str:
+    """messages[start:end] 구간을 하나의 HTML 문자열로 생성"""
+    bubbles = [render_bubble(messages[i][1], messages[i][2]) for i in range(start, end)]
+    return "<div class='chat-window'>" + "".join(bubbles) + "</div>"
+
+
+def visible_window(end: int, window_size: Optional[int], pages: int = 1) -> Tuple[int, int]:
+    """
+    화면에 그릴 메시지 구간 [start, end) 계산
+    - window_size가 None이면 전체 구간
+    - pages: "이전 대화 더 보기"로 펼친 횟수 + 1
+    """
+    if window_size is None:
+        return 0, end
+    return max(0, end - window_size * pages), end
+
+
+def render_chat_window(
+    messages: Sequence[Tuple[int, str, str]],
+    end: int,
+    key: str,
+    window_size: Optional[int] = CHAT_WINDOW_SIZE,
+) -> None:
+    """
+    messages[:end] 중 마지막 window_size개만 하나의 st.markdown으로 출력
+    - 메시지마다 st.columns / st.markdown을 만들지 않으므로 대화가 길어져도 rerun 비용이 일정
+    - 앞쪽에 남은 메시지가 있으면 "이전 대화 더 보기" 버튼으로 window_size개씩 추가
+    """
+    pages_key = f"{key}_pages"
+    if pages_key not in st.session_state:
+        st.session_state[pages_key] = 1
+
+    start, end = visible_window(end, window_size, st.session_state[pages_key])
+    if start > 0:
+        st.button(
+            f"이전 대화 더 보기 ({start})",
+            key=f"{key}_load_earlier",
+            on_click=_load_earlier,
+            args=(pages_key,),
+        )
+
+    st.markdown(build_chat_html(messages, start, end), unsafe_allow_html=True)
+
+
+def _load_earlier(pages_key: str) -> None:
+    st.session_state[pages_key] += 1
@@ -0,0 +1,168 @@
+import math
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Set, Tuple
+
+import streamlit as st
+
+from result_store import TurnKey, TurnResult, TurnResultStore, make_turn_key
+
+if TYPE_CHECKING: # numpy / pandas는 frame()을 처음 호출할 때 import
+    import numpy as np
+    import pandas as pd
+
+# 대시보드 표의 열 (발화 1개 = 1행)과 열 타입
+ANALYTICS_COLUMNS = ["utterance_id", "speaker", "length", "intent", "request", "latency_ms"]
+ANALYTICS_DTYPES = {
+    "utterance_id": "int64", "speaker": "object", "length": "int64",
+    "intent": "object", "request": "object", "latency_ms": "float64", # None -> NaN
+}
+# 열 배열을 늘릴 때의 최소 행 수 (이후에는 두 배씩)
+FRAME_CHUNK_ROWS = 1024
+# 인텐트별 응답 시간 백분위
+LATENCY_PERCENTILES = (0.50, 0.95)
+
+
+class ConversationAnalytics:
+    """
+    대화 전체의 발화별 결과를 열 단위로 누적하는 저장소
+    - 새 발화는 열 목록에 append만 하고, frame()을 호출할 때 새 행만 미리 할당한 열 배열 뒤에 복사 (발화마다 O(새 행 수))
+    - frame()의 DataFrame은 열 배열의 앞부분을 복사 없이 감싼 것 (읽기 전용으로 사용)
+    - 고객 발화는 인텐트/요약 결과가 나온 뒤에 추가 (그 전까지는 waiting에 보관)
+    - 집계(인텐트 분포, 인텐트별 응답 시간, 화자별 발화 비율)는 pandas 벡터 연산으로 계산
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, list] = {name: [] for name in ANALYTICS_COLUMNS} # frame()에 아직 반영하지 않은 행
+        self._arrays: Dict[str, "np.ndarray"] = {} # 열 배열 (앞의 _rows행만 사용, 나머지는 빈 자리)
+        self._rows = 0 # 열 배열에 반영한 행 수
+        self._frame: Optional["pd.DataFrame"] = None
+        self._seen: Set[TurnKey] = set()
+        self._cursor = 0 # 다음에 확인할 메시지 위치
+        self._waiting: List[Tuple[int, str, str]] = [] # 결과를 기다리는 고객 발화
+
+    def append(self, message: Tuple[int, str, str], result: Optional[TurnResult] = None) -> bool:
+        """발화 1개를 행으로 추가 (이미 추가된 발화면 False)"""
+        key = make_turn_key(message)
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+        utterance_id, sentence, speaker = message
+        latency = result.total_elapsed if result is not None else None
+        self._columns["utterance_id"].append(utterance_id)
+        self._columns["speaker"].append(speaker)
+        self._columns["length"].append(len(sentence))
+        self._columns["intent"].append(result.intent if result is not None else None)
+        self._columns["request"].append(result.request if result is not None else None)
+        self._columns["latency_ms"].append(latency * 1000 if latency is not None else None)
+        return True
+
+    def sync(
+        self,
+        messages: Sequence[Tuple[int, str, str]],
+        index: int,
+        results: TurnResultStore,
+    ) -> List[Tuple[int, str, str]]:
+        """
+        messages[:index + 1] 중 아직 추가하지 않은 발화를 추가
+        상담사 발화는 바로, 고객 발화는 results에 결과가 있을 때 추가하고 결과를 기다리는 고객 발화 목록을 반환
+        """
+        end = min(index + 1, len(messages))
+        for i in range(self._cursor, end):
+            message = messages[i]
+            if message[2] == "고객":
+                self._waiting.append(message)
+            else:
+                self.append(message)
+        self._cursor = max(self._cursor, end)
+
+        waiting = []
+        for message in self._waiting:
+            result = results.get(message)
+            if result is None:
+                waiting.append(message)
+            else:
+                self.append(message, result)
+        self._waiting = waiting
+        return list(waiting)
+
+    def frame(self) -> "pd.DataFrame":
+        """누적된 행의 DataFrame: 새 행만 열 배열에 복사하고, 행이 추가되지 않았으면 이전 DataFrame을 그대로 반환"""
+        import numpy as np
+        import pandas as pd
+        added = len(self._columns["utterance_id"])
+        if self._frame is not None and not added:
+            return self._frame
+        total = self._rows + added
+        if not self._arrays or total > len(self._arrays["utterance_id"]):
+            # 자리가 모자랄 때만 두 배 크기로 옮김 (발화 1개당 복사량은 평균 O(1))
+            capacity = max(FRAME_CHUNK_ROWS, 2 * total)
+            arrays = {name: np.empty(capacity, dtype=ANALYTICS_DTYPES[name]) for name in ANALYTICS_COLUMNS}
+            for name, array in self._arrays.items():
+                arrays[name][:self._rows] = array[:self._rows]
+            self._arrays = arrays
+        for name, values in self._columns.items():
+            self._arrays[name][self._rows:total] = values
+            values.clear()
+        self._rows = total
+        # 이미 만든 DataFrame이 보는 앞부분은 바뀌지 않으므로 복사 없이 감쌈 (object 열도 타입 추론 없이)
+        self._frame = pd.DataFrame({
+            name: pd.Series(array[:total], dtype=array.dtype, copy=False) for name, array in self._arrays.items()
+        }, copy=False)
+        return self._frame
+
+    def intent_distribution(self, df: Optional["pd.DataFrame"] = None) -> "pd.DataFrame":
+        """인텐트별 발화 수와 비율"""
+        import pandas as pd
+        df = self.frame() if df is None else df
+        counts = df["intent"].dropna().value_counts()
+        return pd.DataFrame({"count": counts, "ratio": (counts / counts.sum()).round(3)})
+
+    def latency_by_intent(self, df: Optional["pd.DataFrame"] = None) -> "pd.DataFrame":
+        """인텐트별 응답 시간(ms) 평균과 백분위"""
+        df = self.frame() if df is None else df
+        grouped = df.dropna(subset=["intent", "latency_ms"]).groupby("intent")["latency_ms"]
+        stats = grouped.agg(["count", "mean"])
+        for q in LATENCY_PERCENTILES:
+            stats[f"p{int(q * 100)}"] = grouped.quantile(q)
+        return stats.round(1)
+
+    def talk_ratio(self, df: Optional["pd.DataFrame"] = None) -> "pd.DataFrame":
+        """화자별 발화 수, 글자 수와 발화량 비율 (글자 수 기준)"""
+        df = self.frame() if df is None else df
+        stats = df.groupby("speaker")["length"].agg(turns="count", chars="sum")
+        stats["ratio"] = (stats["chars"] / stats["chars"].sum()).round(3)
+        return stats
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def __len__(self) -> int:
+        return self._rows + len(self._columns["utterance_id"])
+
+
+def render_dashboard(analytics: ConversationAnalytics) -> None:
+    """대화 분석 대시보드: 집계는 실행마다 한 번만 계산"""
+    df = analytics.frame()
+    if df.empty:
+        st.caption("분석할 발화가 없습니다.")
+        return
+
+    distribution = analytics.intent_distribution(df)
+    latency = analytics.latency_by_intent(df)
+    talk = analytics.talk_ratio(df)
+
+    customer_turns, agent_turns = (df["speaker"] == "고객").sum(), (df["speaker"] == "상담사").sum()
+    mean_latency = df["latency_ms"].mean() # 값이 없으면 NaN
+    turns_col, intent_col, latency_col = st.columns(3)
+    turns_col.metric("발화 수", f"{len(df)}", help=f"고객 {customer_turns} / 상담사 {agent_turns}")
+    intent_col.metric("인텐트 수", f"{len(distribution)}")
+    latency_col.metric("평균 응답속도", f"{mean_latency:.0f} ms" if not math.isnan(mean_latency) else "-")
+
+    st.caption("인텐트 분포")
+    if distribution.empty:
+        st.write("인텐트 결과가 없습니다.")
+    else:
+        st.bar_chart(distribution["count"], height=160)
+    st.caption("인텐트별 응답속도 (ms)")
+    st.dataframe(latency, use_container_width=True)
+    st.caption("화자별 발화 비율")
+    st.dataframe(talk, use_container_width=True)
@@ -0,0 +1,78 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from message_store import CompactConversation
+
+
+class ConversationCache:
+    """
+    대화 전문의 해시값을 키로 전처리 결과를 저장하는 LRU 캐시
+    - 동일한 대화 내용이 다시 들어오면 전처리를 생략하고 저장된 결과를 반환
+    - max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - hits / misses 카운터로 캐시 효율 확인 가능
+    """
+
+    def __init__(self, max_entries: int = 32):
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock() # Streamlit 세션 스레드 간 공유
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        """대화 전문을 고정 길이 키로 변환"""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_or_compute(self, text: str, compute: Callable[[str], Any]) -> Any:
+        """
+        캐시에 결과가 있으면 반환하고, 없으면 compute(text)를 실행해 저장 후 반환
+        """
+        key = self.make_key(text)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # 전처리는 lock 밖에서 수행: 다른 세션의 조회를 막지 않음
+        value = compute(text)
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 상태(hits, misses, size) 반환"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def process_conversation_cached(
+    cache: ConversationCache, preprocessor: Any, conversation: str
+) -> Tuple[str, CompactConversation]:
+    """
+    ChatPreprocessor.process_conversation 결과를 캐시를 거쳐 반환
+    split_speaker_sentence는 CompactConversation으로 변환해 저장 (캐시와 세션 상태의 메모리 절약)
+    """
+    def compute(text: str) -> Tuple[str, CompactConversation]:
+        processed_conversation, split_speaker_sentence = preprocessor.process_conversation(text)
+        return processed_conversation, CompactConversation(split_speaker_sentence)
+    return cache.get_or_compute(conversation, compute)
@@ -0,0 +1,58 @@
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Pattern
+
+HIGHLIGHT_TEMPLATE = '<b><span style="color:red;">{}</span></b>'
+
+
+def _trie_regex(trie: Dict[str, dict]) -> str:
+    """
+    키워드 trie를 정규식으로 변환
+    - 공통 접두사를 한 번만 비교하므로 키워드 수가 많아도 위치마다 비교 비용이 키워드 길이 수준
+    - 더 긴 키워드로 이어지는 분기를 greedy하게 먼저 시도하므로 같은 위치에서는 가장 긴 키워드가 선택됨
+    """
+    is_end = "" in trie
+    branches = [re.escape(char) + _trie_regex(child) for char, child in sorted(trie.items()) if char]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if is_end:
+        # 여기서 끝나는 키워드가 있으면 뒷부분은 선택 사항
+        return ("(?:" + body + ")?") if len(branches) == 1 else body + "?"
+    return body
+
+
+@lru_cache(maxsize=64)
+def compile_keywords(keywords: FrozenSet[str]) -> Optional[Pattern]:
+    """키워드 집합을 하나의 정규식으로 컴파일 (키워드 집합마다 한 번만 수행)"""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        if not keyword:
+            continue
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    if not trie:
+        return None
+    return re.compile(_trie_regex(trie))
+
+
+def highlight_keywords(text: str, keywords: Iterable[str]) -> str:
+    """
+    키워드를 굵은 빨간색으로 강조한 HTML 반환
+    - 텍스트를 한 번만 훑으며, 겹치는 키워드는 왼쪽에서 먼저 시작하는 것 중 가장 긴 키워드를 강조
+    - 이미 삽입한 <span> 태그 안을 다시 매칭하지 않음
+    """
+    pattern = compile_keywords(frozenset(keywords))
+    if pattern is None:
+        return text
+
+    parts = []
+    position = 0
+    for match in pattern.finditer(text):
+        parts.append(text[position:match.start()])
+        parts.append(HIGHLIGHT_TEMPLATE.format(match.group().replace(" ", "&nbsp;"))) # 공백 포함 시 처리
+        position = match.end()
+    parts.append(text[position:])
+    return "".join(parts)
@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 인텐트 분류 API 기본 설정: 환경 변수로 변경 가능
+DEFAULT_INTENT_API_URL = os.getenv("INTENT_API_URL", "http://192.168.0.90:43307/llm_intent_select2")
+DEFAULT_CONNECT_TIMEOUT = float(os.getenv("INTENT_CONNECT_TIMEOUT", "3"))
+DEFAULT_READ_TIMEOUT = float(os.getenv("INTENT_READ_TIMEOUT", "60"))
+
+
+class TTLCache:
+    """
+    유효 시간(ttl)과 최대 크기(max_entries)가 있는 LRU 캐시
+    - 만료된 항목은 조회 시 제거
+    - max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None or item[0] < time.monotonic():
+                if item is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+class IntentClient:
+    """
+    인텐트 분류 API(llm_intent_select2) 클라이언트
+    - keep-alive 연결 풀(requests.Session)을 재사용
+    - connect / read timeout 및 backoff 재시도
+    - 같은 query의 응답은 TTL 캐시에서 반환
+    - 응답 JSON은 한 번만 디코딩해 dict로 반환
+    """
+
+    def __init__(
+        self,
+        api_url: str = DEFAULT_INTENT_API_URL,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        retries: int = 2,
+        backoff_factor: float = 0.5,
+        pool_size: int = 10,
+        cache_ttl: float = 600.0,
+        cache_size: int = 1024,
+    ):
+        self.api_url = api_url
+        self.timeout = (connect_timeout, read_timeout)
+        self.cache = TTLCache(max_entries=cache_size, ttl=cache_ttl)
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"POST"}), # 인텐트 분류는 조회성 요청이므로 POST도 재시도
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def select_intent(self, query: str) -> Dict[str, Any]:
+        """
+        query에 대한 인텐트 분류 결과(dict) 반환
+        반환 예: {"selected_intent_data": ..., "intent_response_time": ..., "Intent": ..., "Request": ...}
+        """
+        cached = self.cache.get(query)
+        if cached is not None:
+            return cached
+
+        response = self.session.post(self.api_url, json={"query": query}, timeout=self.timeout)
+        response.raise_for_status()
+        payload = response.json()
+        self.cache.set(query, payload)
+        return payload
+
+    def close(self) -> None:
+        self.session.close()
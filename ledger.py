@@ -0,0 +1,259 @@
+import io
+import os
+import re
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 급여 장부 파일: 환경 변수로 변경 가능
+DEFAULT_LEDGER_PATH = os.getenv("LEDGER_PATH", "income.md")
+
+# 표 제목(## ...)에 들어 있는 단어로 지급 / 공제 표 구분
+PAYMENT_SECTION = "수입"
+DEDUCTION_SECTION = "공제"
+
+GROSS_PAY = "지급총액"
+TOTAL_DEDUCTION = "공제총액"
+NET_PAY = "차인지급액"
+TOTAL_COLUMNS = (GROSS_PAY, TOTAL_DEDUCTION, NET_PAY)
+# 표에 기록된 합계 열 이름 앞에 붙이는 표시 (계산한 합계와 구분)
+RECORDED_PREFIX = "기록_"
+
+# 값과 상관없이 항상 키(문자열)로 읽는 열: 이 이름들과 첫 번째 열(행 이름), 숫자가 아닌 값이 있는 열이 키
+# (월, 연도처럼 숫자만 적힌 키 열이 금액으로 합산되지 않도록 열 이름 / 위치로 정함)
+KEY_COLUMNS = ("연도", "년도", "월", "년월", "지급일", "직원", "성명", "이름", "사번", "부서", "구분")
+
+# 제목 줄(## ...) 또는 '|'로 시작하는 줄이 이어진 표 블록
+_BLOCK_RE = re.compile(r"^#{1,6}[ \t]*(.*?)[ \t#]*$|^([ \t]*\|.*(?:\n[ \t]*\|.*)*)", re.MULTILINE)
+_ALIGN_ROW_RE = re.compile(r"^[\s:|-]+$")
+_CELL_SPACE_RE = re.compile(r"[ \t]*\|[ \t]*")
+
+# 경로별 (수정 시각, 크기, Ledger): 프로세스 전체에서 공유
+_ledger_cache: Dict[str, Tuple[int, int, "Ledger"]] = {}
+_lock = threading.Lock()
+
+
+def iter_markdown_tables(text: str) -> Iterator[Tuple[str, List[str], str]]:
+    """
+    Markdown 문서의 표를 (바로 위 제목, 헤더, 본문) 순서대로 반환
+    - 헤더 셀은 앞뒤 공백과 강조 표시(*, **)를 제거
+    - 본문은 줄 앞뒤의 '|'와 셀 앞뒤 공백을 제거한 문자열 (줄 단위로 나누지 않음)
+    """
+    section = ""
+    for match in _BLOCK_RE.finditer(text):
+        if match.group(2) is None:
+            section = match.group(1)
+            continue
+        block = match.group(2)
+        if " |" in block or "| " in block or "\t" in block: # 정렬용 공백이 있는 표만 정리
+            block = _CELL_SPACE_RE.sub("|", block)
+        header_line, _, body = block.strip().partition("\n")
+        align_line, _, rest = body.partition("\n")
+        if _ALIGN_ROW_RE.match(align_line):
+            body = rest
+        header = [cell.strip("*_") for cell in header_line.strip("|").split("|")]
+        body = f"\n{body}\n".replace("\n|", "\n").replace("|\n", "\n").strip("\n")
+        yield section, header, body
+
+
+def is_key_column(name: str, position: int) -> bool:
+    """값과 상관없이 키로 읽는 열: 첫 번째 열 또는 KEY_COLUMNS에 있는 이름"""
+    return position == 0 or name in KEY_COLUMNS
+
+
+def table_to_frame(header: Sequence[str], body: str) -> pd.DataFrame:
+    """
+    표 1개 -> 열 단위 타입을 가진 DataFrame (본문은 pandas C 파서로 한 번에 읽음)
+    - 키 열(is_key_column, 숫자가 아닌 값이 있는 열): category
+    - 금액 열: 천 단위 쉼표와 강조 표시 제거 후 int64, '-'와 빈 칸은 0
+    """
+    keys = {name for position, name in enumerate(header) if is_key_column(name, position)}
+    if not body:
+        return pd.DataFrame({name: pd.Series(dtype="category" if name in keys else "int64") for name in header})
+    df = pd.read_csv(
+        io.StringIO(body.replace("*", "")), sep="|", header=None, names=list(header), thousands=",",
+        dtype={name: str for name in keys},
+        na_values=["-", ""], keep_default_na=False,
+    )
+    for name in df.columns:
+        if name in keys or not pd.api.types.is_numeric_dtype(df[name]):
+            df[name] = df[name].fillna("").astype(str).astype("category")
+        else:
+            df[name] = df[name].fillna(0).astype("int64")
+    return df
+
+
+def key_columns(df: pd.DataFrame) -> List[str]:
+    """키 열: table_to_frame이 키로 읽은 열은 category"""
+    return [name for name in df.columns if isinstance(df[name].dtype, pd.CategoricalDtype)]
+
+
+def item_columns(df: pd.DataFrame) -> List[str]:
+    """키 열과 합계 열을 제외한 금액 열 (지급 / 공제 항목)"""
+    keys = set(key_columns(df))
+    return [
+        name for name in df.columns
+        if name not in keys and name not in TOTAL_COLUMNS and pd.api.types.is_integer_dtype(df[name])
+    ]
+
+
+def _concat(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """같은 종류의 표 여러 개(연도별 등)를 하나로: 없는 항목은 0, 없는 합계 열은 <NA>, 키 열은 category 유지"""
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    df = pd.concat(frames, ignore_index=True)
+    for name in df.columns:
+        if any(name in frame.columns and isinstance(frame[name].dtype, pd.CategoricalDtype) for frame in frames):
+            df[name] = df[name].astype("category")
+        elif name in TOTAL_COLUMNS:
+            df[name] = df[name].astype("Int64") # 합계를 적지 않은 표는 검사하지 않음
+        else:
+            df[name] = df[name].fillna(0).astype("int64")
+    return df
+
+
+class Ledger:
+    """
+    급여 장부: 지급 표(수입)와 공제 표(공제금)
+    - 표는 키 열(구분, 직원 등) + 항목별 금액 열, 표에 적힌 합계 열(지급총액 등)은 검사에만 사용
+    - 합계와 검사 결과는 처음 요청할 때 한 번만 계산 (load_ledger가 파일이 바뀔 때까지 같은 객체를 반환)
+    """
+
+    def __init__(self, payments: pd.DataFrame, deductions: pd.DataFrame):
+        self.payments = payments
+        self.deductions = deductions
+        self.keys = [name for name in key_columns(payments) if name in set(key_columns(deductions))]
+        if not self.keys:
+            raise ValueError("지급 표와 공제 표에 공통 키 열(구분 등)이 없습니다")
+        self._totals: Optional[pd.DataFrame] = None
+        self._issues: Optional[pd.DataFrame] = None
+
+    def totals(self) -> pd.DataFrame:
+        """키별 지급총액, 공제총액, 차인지급액 (+ 표에 기록된 합계 기록_*)"""
+        if self._totals is None:
+            self._totals = self._compute_totals()
+        return self._totals
+
+    def _compute_totals(self) -> pd.DataFrame:
+        payments = self.payments[self.keys].copy()
+        payments[GROSS_PAY] = self.payments[item_columns(self.payments)].to_numpy().sum(axis=1)
+        deductions = self.deductions[self.keys].copy()
+        deductions[TOTAL_DEDUCTION] = self.deductions[item_columns(self.deductions)].to_numpy().sum(axis=1)
+        for source, target in ((self.payments, payments), (self.deductions, deductions)):
+            for name in TOTAL_COLUMNS:
+                if name in source.columns:
+                    target[RECORDED_PREFIX + name] = source[name]
+
+        # 같은 표에 같은 키가 여러 번 있으면 키별로 합산 (check()에서 중복 키로 보고)
+        # -> 키마다 한 행이므로 병합 시 행이 곱해지지 않음
+        payments, deductions = (
+            frame.groupby(self.keys, observed=True, sort=False, as_index=False).sum(min_count=1)
+            if frame.duplicated(self.keys).any() else frame
+            for frame in (payments, deductions)
+        )
+        # 한쪽 표에만 있는 키는 다른 쪽 금액을 0으로 계산 (check()에서 별도로 보고)
+        df = payments.merge(deductions, on=self.keys, how="outer", sort=False, validate="one_to_one")
+        for name in (GROSS_PAY, TOTAL_DEDUCTION):
+            df[name] = df[name].fillna(0).astype("int64")
+        df[NET_PAY] = df[GROSS_PAY] - df[TOTAL_DEDUCTION]
+        recorded = [name for name in df.columns if name.startswith(RECORDED_PREFIX)]
+        for name in recorded:
+            df[name] = df[name].astype("Int64") # 한쪽 표에만 있는 키는 <NA>
+        return df[self.keys + [GROSS_PAY, TOTAL_DEDUCTION, NET_PAY] + recorded]
+
+    def check(self) -> pd.DataFrame:
+        """
+        일관성 검사 결과 (문제가 없으면 빈 DataFrame)
+        - 합계 불일치: 표에 적힌 지급총액 / 공제총액 / 차인지급액이 항목 합계로 계산한 값과 다름
+        - 중복 키: 같은 표에 같은 키(예: 같은 직원의 같은 달)가 두 번 이상
+        - 누락: 지급 표와 공제 표 중 한쪽에만 있는 키
+        """
+        if self._issues is None:
+            self._issues = self._check()
+        return self._issues
+
+    def _check(self) -> pd.DataFrame:
+        issues = []
+        totals = self.totals()
+        for name in TOTAL_COLUMNS:
+            recorded = RECORDED_PREFIX + name
+            if recorded not in totals.columns:
+                continue
+            mismatch = totals[totals[recorded].notna() & (totals[recorded] != totals[name])]
+            issues.append(pd.DataFrame({
+                **{key: mismatch[key] for key in self.keys},
+                "검사": "합계 불일치",
+                "항목": name,
+                "기록값": mismatch[recorded],
+                "계산값": mismatch[name],
+            }))
+
+        for label, df in (("지급", self.payments), ("공제", self.deductions)):
+            duplicated = df[df.duplicated(self.keys, keep="first")]
+            issues.append(pd.DataFrame({**{key: duplicated[key] for key in self.keys}, "검사": "중복 키", "항목": label}))
+
+        keys = self.payments[self.keys].merge(
+            self.deductions[self.keys].drop_duplicates(), on=self.keys, how="outer", indicator=True)
+        missing = keys[keys["_merge"] != "both"]
+        issues.append(pd.DataFrame({
+            **{key: missing[key] for key in self.keys},
+            "검사": "누락",
+            "항목": missing["_merge"].map({"left_only": "공제 표 없음", "right_only": "지급 표 없음"}).astype(object),
+        }))
+
+        issues = [issue for issue in issues if not issue.empty]
+        if not issues:
+            return pd.DataFrame(columns=self.keys + ["검사", "항목", "기록값", "계산값", "차이"])
+        df = pd.concat(issues, ignore_index=True).reindex(columns=self.keys + ["검사", "항목", "기록값", "계산값"])
+        df[["기록값", "계산값"]] = df[["기록값", "계산값"]].astype("Int64")
+        df["차이"] = df["기록값"] - df["계산값"]
+        return df
+
+    def __len__(self) -> int:
+        return len(self.totals())
+
+
+def parse_ledger(text: str) -> Ledger:
+    """
+    Markdown 문서의 지급 표(제목에 '수입')와 공제 표(제목에 '공제')를 읽어 Ledger 생성
+    - 같은 종류 + 같은 헤더의 표(연도별 표 등)는 본문을 이어 붙여 한 번에 읽음
+    """
+    bodies: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+    for section, header, body in iter_markdown_tables(text):
+        if PAYMENT_SECTION in section:
+            kind = PAYMENT_SECTION
+        elif DEDUCTION_SECTION in section:
+            kind = DEDUCTION_SECTION
+        else:
+            continue
+        bodies.setdefault((kind, tuple(header)), []).append(body)
+
+    frames: Dict[str, List[pd.DataFrame]] = {PAYMENT_SECTION: [], DEDUCTION_SECTION: []}
+    for (kind, header), parts in bodies.items():
+        frames[kind].append(table_to_frame(header, "\n".join(part for part in parts if part)))
+    if not frames[PAYMENT_SECTION] or not frames[DEDUCTION_SECTION]:
+        raise ValueError(f"'{PAYMENT_SECTION}' 표와 '{DEDUCTION_SECTION}' 표가 모두 필요합니다")
+    return Ledger(_concat(frames[PAYMENT_SECTION]), _concat(frames[DEDUCTION_SECTION]))
+
+
+def load_ledger(path: str = DEFAULT_LEDGER_PATH) -> Ledger:
+    """
+    급여 장부 파일을 읽어 Ledger 반환
+    - 프로세스당 한 번만 읽고, 파일 수정 시각(mtime) 또는 크기가 바뀌면 다시 읽음
+    """
+    full_path = path if os.path.isabs(path) else os.path.join(ROOT_DIR, path)
+    stat = os.stat(full_path)
+    with _lock:
+        cached = _ledger_cache.get(full_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+    with open(full_path, encoding="utf-8") as f:
+        ledger = parse_ledger(f.read())
+    with _lock:
+        _ledger_cache[full_path] = (stat.st_mtime_ns, stat.st_size, ledger)
+    return ledger
@@ -0,0 +1,73 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Optional
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024 # 파일 하나의 최대 크기
+DEFAULT_BACKUP_COUNT = 5 # 보관할 이전 로그 파일 수
+
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
+
+
+class JsonLineFormatter(logging.Formatter):
+    """로그 한 건을 JSON 한 줄로 출력"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def setup_logging(
+    filename: str = 'logs/streamlit_app.log',
+    level: int = logging.INFO,
+    json_lines: Optional[bool] = None,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+) -> QueueListener:
+    """
+    프로세스당 한 번만 로깅 설정 (이미 설정되어 있으면 기존 listener 반환)
+    - 로그 호출 스레드는 QueueHandler로 큐에 넣기만 하고, 파일 쓰기는 QueueListener 스레드가 담당
+    - 파일 크기가 max_bytes를 넘으면 회전(RotatingFileHandler)
+    - json_lines가 True이면 JSON 한 줄 형식으로 기록 (None이면 LOG_JSON 환경 변수 사용)
+    - 환경 변수 LOG_FILE로 파일 경로 변경 가능, 경로의 {pid}는 프로세스 ID로 치환 (멀티 워커용)
+    """
+    global _listener
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        filename = os.getenv("LOG_FILE", filename).format(pid=os.getpid())
+        if not os.path.isabs(filename):
+            filename = os.path.join(ROOT_DIR, filename)
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        if json_lines is None:
+            json_lines = os.getenv("LOG_JSON", "").lower() in ("1", "true", "yes")
+
+        file_handler = RotatingFileHandler(
+            filename, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+        file_handler.setFormatter(JsonLineFormatter() if json_lines else logging.Formatter(LOG_FORMAT))
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root = logging.getLogger()
+        root.setLevel(level)
+        root.addHandler(QueueHandler(log_queue))
+
+        _listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop) # 종료 시 큐에 남은 로그까지 기록
+        return _listener
@@ -1,23 +1,31 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import logging
-import re
-import pandas as pd
-from typing import List, Tuple
-
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    filename='logs/streamlit_app.log'
-)
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from transcript_parser import IncrementalTranscriptParser
+from chat_history import ChatHistory
+from message_store import CompactConversation
+from assets import inject_css
+from chat_render import render_chat_window
+from logging_setup import setup_logging
+from perf import record, render_perf_panel, stage_timer
+from prefetch import make_query
+from result_store import last_customer_message, make_turn_key
+# pandas, requests (stream_client), preprocess are imported on first use so the first paint does not wait for them
+if TYPE_CHECKING:
+    from preprocess import ChatPreprocessor
+    from stream_client import StreamingLLMClient, StreamResult
+
+# 로깅 설정: 프로세스당 한 번만 설정, 파일 쓰기는 별도 스레드에서 수행
+setup_logging('logs/streamlit_app.log')
 
 logger = logging.getLogger('streamlit_app')
 
 st.set_page_config(layout="wide")
 
-# Load external CSS
-with open('assets/css/style.css', encoding='utf-8') as f:
-    st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+# Load external CSS: read and minified once per process, re-read only when the file changes
+inject_css('assets/css/style.css', 'assets/css/chat.css')
 
 def init_components():
     """필요한 컴포넌트들을 초기화하고 세션 상태에 저장
@@ -38,7 +46,8 @@ def init_components():
         "current_analysis": None,
         "user_message": "",
         "speaker": "고객",
-        "chat_history": [],
+        "chat_history": ChatHistory(), # 채팅 기록 + (role, content) 중복 확인 인덱스
+        "chat_parser": IncrementalTranscriptParser(), # 대화 전문 증분 파서
         # "response_times": pd.DataFrame(columns=["timestamp", "total_response_time_sec"]),
         # "show_checklist": False  # 체크리스트 표시 상태 추가
     }
@@ -54,21 +63,22 @@ def convert_initial_chat_to_history():
     고객 발화와 상담사 발화 사이에 시스템 메시지를 삽입합니다.
     """
     if st.session_state.chat and st.session_state.chat.strip():
-        # 정규식으로 발화자 및 메시지 추출
-        pattern = r"(고객|상담사[a-zA-Z0-9]?)\)\s*(.*?)(?=(?:\n(?:고객|상담사[a-zA-Z0-9]?)\)|\Z))"
-        entries = re.findall(pattern, st.session_state.chat, re.DOTALL)
+        # 새로 추가된 부분에서만 발화자 및 메시지 추출
+        if "chat_parser" not in st.session_state:
+            st.session_state.chat_parser = IncrementalTranscriptParser()
+        entries = st.session_state.chat_parser.feed(st.session_state.chat)
 
         # 채팅 기록이 없을 때만 초기화
         if "chat_history" not in st.session_state or not st.session_state.chat_history:
-            st.session_state.chat_history = []
+            st.session_state.chat_history = ChatHistory()
         
         # Display chat history
         with ChatContainer:
             for message in st.session_state.chat_history:
                 if message["role"] == "user":
-                    st.markdown(f"<div style='text-align: right; margin: 10px;'><div style='background-color: #e3f2fd; padding: 10px; border-radius: 10px; display: inline-block;'>{message['content']}</div></div>", unsafe_allow_html=True)
+                    st.markdown(f"<div class='history user'><div>{message['content']}</div></div>", unsafe_allow_html=True)
                 else:
-                    st.markdown(f"<div style='text-align: left; margin: 10px;'><div style='background-color: #f5f5f5; padding: 10px; border-radius: 10px; display: inline-block;'>{message['content']}</div></div>", unsafe_allow_html=True)
+                    st.markdown(f"<div class='history bot'><div>{message['content']}</div></div>", unsafe_allow_html=True)
         
         # Chat input
         user_input = st.text_input("Type your message:", key="chat_input")
@@ -85,23 +95,9 @@ def convert_initial_chat_to_history():
         system_message_count = 0  # 시스템 메시지 카운터
         customer_message_count = 0  # 고객 발화 카운터 추가
 
-        # 각 메시지를 채팅 기록에 추가
-        for i, (role, msg) in enumerate(entries):
-            # 상담사 발화의 경우 role을 '상담사'로 통일
-            if role.startswith('상담사'):
-                role = '상담사'
-
-            # 이미 존재하는 메시지인지 확인
-            is_duplicate = any(
-                existing_msg["role"] == role and existing_msg["content"] == msg.strip()
-                for existing_msg in st.session_state.chat_history
-            )
-
-            if not is_duplicate:
-                st.session_state.chat_history.append({
-                    "role": role,
-                    "content": msg.strip()
-                })
+        # 각 메시지를 채팅 기록에 추가: 상담사 role 통일 및 중복 확인은 ChatHistory가 처리
+        for role, msg in entries:
+            st.session_state.chat_history.add_if_new(role, msg)
 
 def handle_input():
     """사용자 입력 처리 함수"""
@@ -121,7 +117,8 @@ def handle_input():
         # st.session_state.current_analysis = result
         
         # 4. 대화 전문 변환
-        convert_initial_chat_to_history()
+        with stage_timer("convert_chat_history"):
+            convert_initial_chat_to_history()
 
 def handle_chat_input():
     """채팅 입력 처리 함수"""
@@ -165,60 +162,88 @@ def init_session_state():
         st.session_state.chat_index = 0
     if "current_message" not in st.session_state: # Tuple[int, str, str]: Current message
         st.session_state.current_message = None
+    if "stream_results" not in st.session_state: # Dict[(utterance_id, sentence hash), StreamResult]: Finished streaming results
+        st.session_state.stream_results = {}
+
+# Conversation preprocessor: created once per process, when the first conversation is processed
+@st.cache_resource
+def get_preprocessor() -> "ChatPreprocessor":
+    from preprocess import ChatPreprocessor
+    return ChatPreprocessor()
+
+# Streaming intent + summary client: connection pool shared by all sessions
+@st.cache_resource
+def get_stream_client() -> "StreamingLLMClient":
+    from stream_client import StreamingLLMClient
+    return StreamingLLMClient()
+
+def render_intent(container, intent_data: Dict[str, Any]) -> None:
+    container.markdown(f"**Intent**: {intent_data.get('Intent', '')}  \n**Request**: {intent_data.get('Request', '')}")
+
+def render_stream_timing(result: "StreamResult") -> None:
+    ttft, total = result.time_to_first_token(), result.total_elapsed()
+    if ttft is not None and total is not None:
+        st.caption(f"First token {ttft:.3f}s / total {total:.3f}s")
+
+# Streaming summary: intent first, then summary tokens as they arrive
+def streaming_summary_panel() -> None:
+    import requests
+    from stream_client import StreamResult
+    st.write("Result of Summarization (streaming)")
+    if st.session_state.current_message is None:
+        st.write("Press Next to start")
+        return
+    target = last_customer_message(st.session_state.split_speaker_sentence, st.session_state.chat_index)
+    if target is None:
+        st.write("No customer utterance yet")
+        return
+
+    # Already streamed: render the stored result without calling the server again
+    key = make_turn_key(target)
+    result = st.session_state.stream_results.get(key)
+    if result is not None:
+        render_intent(st.container(), result.intent_data)
+        st.write(result.summary)
+        render_stream_timing(result)
+        return
+
+    result = StreamResult()
+    intent_area = st.empty()
+    intent_area.caption("Waiting for the first token...")
+    try:
+        st.write_stream(get_stream_client().stream_summary(
+            make_query(target), result, on_intent=lambda intent_data: render_intent(intent_area, intent_data)))
+    except (requests.RequestException, ValueError, KeyError) as e: # ValueError: malformed NDJSON line or event
+        logger.error(f"[ERROR] Streaming request failed: {e}")
+        st.error(f"Streaming request failed: {e}")
+        return
+    if result.first_token_at is not None:
+        record("stream_first_token", result.time_to_first_token())
+    record("stream_total", result.total_elapsed())
+    st.session_state.stream_results[key] = result
+    render_stream_timing(result)
+
+# Whether only fragments are rerunning (False on a full run)
+def is_fragment_rerun() -> bool:
+    ctx = get_script_run_ctx()
+    return ctx is not None and bool(ctx.fragment_ids_this_run)
 
 # Generate chatting UI: Display the entire conversation
 def chat_ui_total(messages: List[Tuple[int, str, str]]) -> None:
     chat_content = st.container(height=450)
     chat_area = chat_content.container()
     with chat_area:
-        for message in messages:
-            _, sentence, speaker = message
-            if speaker == '상담사':
-                _, col_agent = st.columns([1, 5])
-                with col_agent:
-                    st.markdown(f"""
-                                <div style='text-align: right; 
-                                background-color: rgb(250,226,213); 
-                                padding: 10px; border-radius: 10px; 
-                                width: fit-content; margin-left: auto; margin-bottom: 10px;'>
-                                <strong>상담사</strong><br>{sentence}</div>""", unsafe_allow_html=True)
-            else:
-                col_user, _ = st.columns([5, 1])
-                with col_user:
-                    st.markdown(f"""
-                                <div style='text-align: left; 
-                                background-color: rgb(226,232,240); 
-                                padding: 10px; border-radius: 10px; 
-                                width: fit-content; margin-right: auto; margin-bottom: 10px;'>
-                                <strong>고객</strong><br>{sentence}</div>""", unsafe_allow_html=True)
+        render_chat_window(messages, len(messages), key="chat_total")
 
 # Generate chatting UI: Display the conversation in order
 def chat_ui_sequential(messages: List[Tuple[int, str, str]]) -> None:
     chat_content = st.container(height=450)
     chat_area = chat_content.container()
 
-    # Accumulate output
+    # Accumulate output: render only the last CHAT_WINDOW_SIZE bubbles as one payload
     with chat_area:
-        for i in range(st.session_state.chat_index + 1):
-            if i < len(messages):
-                message = messages[i]
-                idx, sentence, speaker = message
-                if speaker == '상담사':
-                    _, col_agent = st.columns([1, 5])
-                    with col_agent:
-                        st.markdown(f"""
-                            <div style='text-align: right; background-color: rgb(250,226,213); 
-                            padding: 10px; border-radius: 10px; width: fit-content; 
-                            margin-left: auto; margin-bottom: 10px;'>
-                            <strong>상담사</strong><br>{sentence}</div>""", unsafe_allow_html=True)
-                else:
-                    col_user, _ = st.columns([5, 1])
-                    with col_user:
-                        st.markdown(f"""
-                            <div style='text-align: left; background-color: rgb(226,232,240); 
-                            padding: 10px; border-radius: 10px; width: fit-content; 
-                            margin-right: auto; margin-bottom: 10px;'>
-                            <strong>고객</strong><br>{sentence}</div>""", unsafe_allow_html=True)
+        end = min(st.session_state.chat_index + 1, len(messages))
+        render_chat_window(messages, end, key="chat_sequential")
 
 # def main():
 #     # Sidebar
@@ -283,25 +308,10 @@ def chat_ui_sequential(messages: List[Tuple[int, str, str]]) -> None:
 #     with footer:
 #         st.markdown("<div style='text-align: center;'>Footer Section</div>", unsafe_allow_html=True)
 
-def main():
-    # 1. Split area with container
-    header_container = st.container() # header area
-    sidebar_container = st.sidebar # sidebar area
-    main_container = st.container() # main area
-    footer_container = st.container() # footer area
-
-    # 2. Generate content in each area
-    # 2.1. Header area
-    with header_container:
-        st.title("Chatting Demo")
-
-    # 2.2. Sidebar area
-    with sidebar_container:
-        st.markdown("#### Debugging Information")
-        st.write(st.session_state.current_message)
-        
-    # 2.3. Main area
-    with main_container:
+# Chat + summary area: Next and conversation input rerun only this fragment
+@st.fragment
+def conversation_area():
+    with stage_timer("conversation_fragment"):
         chat_col, summary_col = st.columns([4, 3])
         with chat_col:
             st.subheader("Chatting")
@@ -319,9 +329,13 @@ def main():
                 next_button = st.button("Next", key="next_button", disabled=st.session_state.convert_text_to_chat)
 
             # Button action
-            if summarize_button:
+            if summarize_button: # Layout changes: rerun the whole app
                 st.session_state.convert_text_to_chat = not st.session_state.convert_text_to_chat
                 st.session_state.convert_summary = not st.session_state.convert_summary
+                st.rerun()
+            if next_button and st.session_state.chat_index < len(st.session_state.split_speaker_sentence) - 1:
+                st.session_state.chat_index += 1
+                st.session_state.current_message = st.session_state.split_speaker_sentence[st.session_state.chat_index]
 
             # Render different elements based on condition
             if st.session_state.convert_text_to_chat:
@@ -333,43 +347,83 @@ def main():
                         placeholder="Enter the conversation",
                         label_visibility="collapsed")
                     if conversation: # If there is conversation, process and update session_state
-                        processed_conversation, split_speaker_sentence = preprocessor.process_conversation(conversation)
+                        with stage_timer("process_conversation"):
+                            processed_conversation, split_speaker_sentence = get_preprocessor().process_conversation(conversation)
+                        changed = processed_conversation != st.session_state.processed_conversation
                         st.session_state.processed_conversation = processed_conversation
-                        st.session_state.split_speaker_sentence = split_speaker_sentence
+                        st.session_state.split_speaker_sentence = CompactConversation(split_speaker_sentence) # Array-backed storage
+                        if changed and is_fragment_rerun():
+                            st.rerun() # Refresh the processed conversation in the footer too
             else:
                 with chat_placeholder:
                     messages = st.session_state.split_speaker_sentence
                     # chat_ui_total(messages) # 전체 대화 내용을 출력
-                    chat_ui_sequential(messages) # 대화 순서대로 출력
+                    with stage_timer("render_chat"):
+                        chat_ui_sequential(messages) # 대화 순서대로 출력
 
         with summary_col:
             st.subheader("Result of Summarization")
 
             # Generate empty placeholder for summary
             summary_placeholder = st.empty()
-            
+
             if st.session_state.convert_summary:
+                import pandas as pd
                 keys = ["1", "2", "3", "4", "5"]
                 values = ["", "", "", "", ""]
                 df = pd.DataFrame({"Item": keys, "Value": values}) # Create DataFrame
                 st.dataframe(df, height=450, hide_index=True, use_container_width=True) # Display DataFrame: height, hide_index, use_container_width
+            elif st.session_state.get("streaming_mode"):
+                with summary_placeholder.container():
+                    streaming_summary_panel()
             else:
                 with summary_placeholder:
+                    import pandas as pd
                     st.write("Result of Summarization")
                     keys = ["1", "2", "3", "4", "5"]
                     values = ["6", "7", "8", "9", "10"]
                     df = pd.DataFrame({"Item": keys, "Value": values})
                     st.dataframe(df, height=450, hide_index=True, use_container_width=True)
 
+# Processed conversation area: redrawn only on full reruns
+@st.fragment
+def footer_area():
+    st.subheader("Processed Conversation")
+    if st.session_state.processed_conversation:
+        st.markdown("```\n" + st.session_state.processed_conversation + "\n```")
+    else:
+        st.write("Enter the conversation for processing")
+
+def main():
+    # 1. Split area with container
+    header_container = st.container() # header area
+    sidebar_container = st.sidebar # sidebar area
+    main_container = st.container() # main area
+    footer_container = st.container() # footer area
+
+    # 2. Generate content in each area
+    # 2.1. Header area
+    with header_container:
+        st.title("Chatting Demo")
+
+    # 2.2. Sidebar area
+    with sidebar_container:
+        st.markdown("#### Debugging Information")
+        st.write(st.session_state.current_message)
+        st.toggle("Streaming mode", key="streaming_mode") # Stream intent + summary tokens into the summary area
+        render_perf_panel("Performance") # Per-stage latency (measured up to the previous run)
+        
+    # 2.3. Main area
+    with main_container:
+        conversation_area()
+
     # 2.4. Footer area
     with footer_container:
-            st.subheader("Processed Conversation")
-            if st.session_state.processed_conversation:
-                st.markdown("```\n" + st.session_state.processed_conversation + "\n```")
-            else:
-                st.write("Enter the conversation for processing")
+        footer_area()
 
 if __name__ == "__main__":
     # init_components()
+    rerun_started = time.perf_counter()
     init_session_state()
     main()
+    record("rerun", time.perf_counter() - rerun_started)
@@ -0,0 +1,89 @@
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Tuple
+
+Message = Tuple[int, str, str] # (utterance_id, sentence, speaker)
+
+
+class CompactConversation(Sequence):
+    """
+    대화 내용을 배열 기반으로 저장하는 컨테이너 (split_speaker_sentence 대체)
+    - utterance_id: int 배열
+    - speaker: 화자 문자열을 코드로 바꾼 byte 배열 (화자 목록은 한 번만 저장)
+    - sentence: UTF-8로 이어 붙인 하나의 버퍼 + 문장별 시작 위치 배열
+    메시지마다 tuple / str 객체를 두지 않으므로 세션이 많을 때 메모리 사용량이 작고,
+    messages[i]는 기존과 같은 (utterance_id, sentence, speaker) tuple을 반환한다.
+    """
+
+    def __init__(self, messages: Iterable[Message] = ()):
+        self._ids = array('q')
+        self._speaker_codes = bytearray()
+        self._speakers: List[str] = [] # 코드 -> 화자
+        self._speaker_index: Dict[str, int] = {} # 화자 -> 코드
+        self._text = bytearray()
+        self._offsets = array('Q', [0]) # i번째 문장: _text[_offsets[i]:_offsets[i + 1]]
+        self.extend(messages)
+
+    def _speaker_code(self, speaker: str) -> int:
+        code = self._speaker_index.get(speaker)
+        if code is None:
+            if len(self._speakers) >= 256:
+                raise ValueError("화자는 최대 256명까지 저장할 수 있습니다")
+            code = len(self._speakers)
+            self._speakers.append(speaker)
+            self._speaker_index[speaker] = code
+        return code
+
+    def append(self, message: Message) -> None:
+        utterance_id, sentence, speaker = message
+        self._ids.append(utterance_id)
+        self._speaker_codes.append(self._speaker_code(speaker))
+        self._text += sentence.encode('utf-8')
+        self._offsets.append(len(self._text))
+
+    def extend(self, messages: Iterable[Message]) -> None:
+        for message in messages:
+            self.append(message)
+
+    def utterance_id(self, index: int) -> int:
+        return self._ids[index]
+
+    def sentence(self, index: int) -> str:
+        index = self._normalize_index(index)
+        return self._text[self._offsets[index]:self._offsets[index + 1]].decode('utf-8')
+
+    def speaker(self, index: int) -> str:
+        return self._speakers[self._speaker_codes[index]]
+
+    def _normalize_index(self, index: int) -> int:
+        if index < 0:
+            index += len(self._ids)
+        if not 0 <= index < len(self._ids):
+            raise IndexError("CompactConversation index out of range")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = self._normalize_index(index)
+        return self._ids[index], self.sentence(index), self.speaker(index)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (CompactConversation, list, tuple)):
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"CompactConversation({len(self)} messages, {len(self._text)} bytes of text)"
+
+    def nbytes(self) -> int:
+        """배열/버퍼가 차지하는 바이트 수 (할당 여유분 제외)"""
+        return (
+            self._ids.itemsize * len(self._ids)
+            + len(self._speaker_codes)
+            + len(self._text)
+            + self._offsets.itemsize * len(self._offsets)
+        )
@@ -0,0 +1,53 @@
+# 급여 장부 화면: income.md 형식의 지급 / 공제 표 합계와 일관성 검사
+# 실행: streamlit run payroll_app.py (app.py / main.py와 별도로 실행)
+import streamlit as st
+from ledger import DEFAULT_LEDGER_PATH, GROSS_PAY, NET_PAY, TOTAL_DEDUCTION, load_ledger
+from perf import render_perf_panel, stage_timer
+
+st.set_page_config(page_title="급여 장부", layout="wide")
+st.title("급여 장부")
+
+# 파일은 수정 시각이 바뀔 때만 다시 읽고, 합계 / 검사 결과도 파일마다 한 번만 계산
+try:
+    with stage_timer("ledger_load"):
+        ledger = load_ledger(DEFAULT_LEDGER_PATH)
+        totals = ledger.totals()
+        issues = ledger.check()
+except (OSError, ValueError) as e:
+    st.error(f"장부를 읽을 수 없습니다({DEFAULT_LEDGER_PATH}): {e}")
+    st.stop()
+
+with st.sidebar:
+    st.caption(f"장부 파일: {DEFAULT_LEDGER_PATH}")
+    render_perf_panel()
+
+# 키 열(연도, 직원 등)별 필터: 마지막 키(구분: 기간)는 제외하고 값이 여러 개인 열만 표시
+view = totals
+for key in ledger.keys:
+    values = list(totals[key].unique())
+    if len(values) > 1 and key != ledger.keys[-1]:
+        selected = st.multiselect(key, values, key=f"ledger_filter_{key}")
+        if selected:
+            view = view[view[key].isin(selected)]
+
+gross_col, deduction_col, net_col, rows_col = st.columns(4)
+gross_col.metric(GROSS_PAY, f"{view[GROSS_PAY].sum():,}원")
+deduction_col.metric(TOTAL_DEDUCTION, f"{view[TOTAL_DEDUCTION].sum():,}원")
+net_col.metric(NET_PAY, f"{view[NET_PAY].sum():,}원")
+rows_col.metric("행 수", f"{len(view):,}")
+
+st.subheader("합계")
+st.dataframe(view, hide_index=True, use_container_width=True)
+
+st.subheader("일관성 검사")
+if issues.empty:
+    st.success("표에 기록된 합계가 계산한 값과 모두 일치합니다.")
+else:
+    st.error(f"문제 {len(issues):,}건")
+    st.dataframe(issues, hide_index=True, use_container_width=True)
+
+with st.expander("지급 / 공제 항목"):
+    st.caption("지급")
+    st.dataframe(ledger.payments, hide_index=True, use_container_width=True)
+    st.caption("공제")
+    st.dataframe(ledger.deductions, hide_index=True, use_container_width=True)
@@ -0,0 +1,136 @@
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# 단계별로 보관하는 최근 측정값 수
+PERF_WINDOW = 500
+# 세션 상태에 저장하는 키
+PERF_SESSION_KEY = "perf_store"
+
+
+class PerfStore:
+    """
+    단계(stage)별 실행 시간 저장소
+    - 최근 window개의 측정값(초)과 전체 호출 횟수를 보관
+    - 프로세스 전체용(PROCESS_PERF)과 세션별(st.session_state)로 각각 사용
+    """
+
+    def __init__(self, window: int = PERF_WINDOW):
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            if stage not in self._samples:
+                self._samples[stage] = deque(maxlen=self.window)
+                self._counts[stage] = 0
+            self._samples[stage].append(seconds)
+            self._counts[stage] += 1
+
+    def samples(self, stage: str) -> List[float]:
+        with self._lock:
+            return list(self._samples.get(stage, ()))
+
+    def mean(self, stage: str) -> Optional[float]:
+        values = self.samples(stage)
+        return sum(values) / len(values) if values else None
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """단계별 호출 횟수, 평균, p50, p95, 최대값(ms)"""
+        with self._lock:
+            snapshot = {stage: (sorted(values), self._counts[stage]) for stage, values in self._samples.items()}
+        result = {}
+        for stage, (values, count) in snapshot.items():
+            if not values:
+                continue
+            result[stage] = {
+                "count": count,
+                "mean_ms": sum(values) / len(values) * 1000,
+                "p50_ms": values[int(0.50 * (len(values) - 1))] * 1000,
+                "p95_ms": values[int(0.95 * (len(values) - 1))] * 1000,
+                "max_ms": values[-1] * 1000,
+            }
+        return result
+
+
+# 프로세스 전체 측정값: 모든 세션과 백그라운드 스레드가 공유
+PROCESS_PERF = PerfStore()
+
+
+def session_perf() -> Optional[PerfStore]:
+    """현재 Streamlit 세션의 측정값 저장소 (스크립트 실행 스레드가 아니면 None)"""
+    if get_script_run_ctx(suppress_warning=True) is None:
+        return None
+    if PERF_SESSION_KEY not in st.session_state:
+        st.session_state[PERF_SESSION_KEY] = PerfStore()
+    return st.session_state[PERF_SESSION_KEY]
+
+
+def record(stage: str, seconds: float) -> None:
+    """측정값을 프로세스 저장소와 (가능하면) 세션 저장소에 기록"""
+    PROCESS_PERF.record(stage, seconds)
+    store = session_perf()
+    if store is not None:
+        store.record(stage, seconds)
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """with 블록의 실행 시간을 stage 이름으로 기록"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(stage, time.perf_counter() - started)
+
+
+def timed(stage: str) -> Callable:
+    """함수 실행 시간을 stage 이름으로 기록하는 decorator"""
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def histogram_labels(edges: Sequence[float]) -> List[str]:
+    """히스토그램 구간 시작값 이름: 구간 폭에 맞춘 소수 자릿수 사용 (1 ms 미만 구간도 이름이 겹치지 않음)"""
+    width = edges[1] - edges[0]
+    digits = max(0, 1 - math.floor(math.log10(width))) if width > 0 else 3
+    return [f"{edge:.{digits}f}" for edge in edges[:-1]]
+
+
+def render_perf_panel(label: str = "성능 정보") -> None:
+    """단계별 지연 시간 표와 히스토그램 (사이드바 디버깅 정보 아래에 사용)"""
+    if not st.checkbox(label, key="show_perf_panel"):
+        return
+    import numpy as np
+    import pandas as pd
+
+    store = session_perf()
+    scope = st.radio("범위", ["세션", "프로세스"], horizontal=True, key="perf_scope")
+    if scope == "프로세스" or store is None:
+        store = PROCESS_PERF
+
+    summary = store.summary()
+    if not summary:
+        st.caption("측정값이 없습니다.")
+        return
+    st.dataframe(pd.DataFrame(summary).T.round(1), use_container_width=True)
+
+    for stage in summary:
+        values_ms = np.asarray(store.samples(stage)) * 1000
+        counts, edges = np.histogram(values_ms, bins=min(20, max(1, len(values_ms))))
+        st.caption(f"{stage} (ms)")
+        st.bar_chart(pd.Series(counts, index=histogram_labels(edges)), height=120)
@@ -0,0 +1,135 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple
+
+from perf import PROCESS_PERF
+from result_store import TurnKey, TurnResultStore, make_turn_key
+
+if TYPE_CHECKING: # 타입 표기에만 사용: main.py가 make_query만 쓸 때 requests / sqlite3를 import하지 않음
+    from intent_client import IntentClient
+    from result_cache import ResultCache
+
+# 현재 발화 이후 미리 요청해 둘 고객 발화 수
+PREFETCH_LOOKAHEAD = 2
+
+
+def make_query(message: Tuple[int, str, str]) -> str:
+    """(utterance_id, sentence, speaker) -> 인텐트/요약 API에 보내는 query 문자열"""
+    _, sentence, speaker = message
+    return speaker + ") " + sentence
+
+
+@dataclass
+class PendingTurn:
+    """한 발화에 대한 인텐트 요청과 요약 요청 (동시에 실행)"""
+    query: str
+    intent_future: Future
+    summary_future: Future
+    started_at: float
+    timings: Dict[str, float] = field(default_factory=dict) # 단계별 실행 시간(초)
+    finished_at: Dict[str, float] = field(default_factory=dict) # 단계별 완료 시각
+
+    def done(self) -> bool:
+        return self.intent_future.done() and self.summary_future.done()
+
+    def result(self) -> Tuple[Dict[str, Any], Any]:
+        """(인텐트 결과, 요약 결과) 반환: 완료 전이면 완료될 때까지 대기"""
+        return self.intent_future.result(), self.summary_future.result()
+
+    def total_elapsed(self) -> Optional[float]:
+        """요청 시작부터 인텐트/요약이 모두 끝날 때까지 걸린 시간(초)"""
+        if not self.done() or not self.finished_at:
+            return None
+        return max(self.finished_at.values()) - self.started_at
+
+
+class TurnPrefetcher:
+    """
+    인텐트 분류 요청과 요약 요청을 백그라운드 스레드에서 실행
+    - 한 발화의 인텐트/요약 요청은 동시에 실행
+    - 현재 발화 이후의 고객 발화도 미리 요청(prefetch)해 "다음"을 눌렀을 때 바로 결과를 보여줌
+    - 실행기는 프로세스 단위로 공유하고, 요청 목록(pending)은 세션마다 따로 관리
+    - result_cache가 있으면 같은 query의 인텐트/요약 결과는 API / LLM을 호출하지 않고 캐시에서 반환
+    """
+
+    def __init__(
+        self,
+        intent_client: "IntentClient",
+        summarize: Callable[[str, dict], Any],
+        max_workers: int = 8,
+        lookahead: int = PREFETCH_LOOKAHEAD,
+        result_cache: Optional["ResultCache"] = None,
+    ):
+        self.intent_client = intent_client
+        self.summarize = summarize
+        self.lookahead = lookahead
+        self.result_cache = result_cache
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="turn-prefetch")
+
+    def submit(self, query: str) -> PendingTurn:
+        timings: Dict[str, float] = {}
+        finished_at: Dict[str, float] = {}
+        started_at = time.perf_counter()
+        return PendingTurn(
+            query=query,
+            intent_future=self.executor.submit(
+                _timed_call, "intent_request", timings, finished_at, self._select_intent, query),
+            summary_future=self.executor.submit(
+                _timed_call, "generate_summary", timings, finished_at, self._summarize, query),
+            started_at=started_at,
+            timings=timings,
+            finished_at=finished_at,
+        )
+
+    def _select_intent(self, query: str) -> Dict[str, Any]:
+        if self.result_cache is None:
+            return self.intent_client.select_intent(query)
+        return self.result_cache.get_or_compute("intent", query, lambda: self.intent_client.select_intent(query))
+
+    def _summarize(self, query: str) -> Any:
+        if self.result_cache is None:
+            return self.summarize(query, {})
+        return self.result_cache.get_or_compute("summary", query, lambda: self.summarize(query, {}))
+
+    def request(
+        self, pending: Dict[TurnKey, PendingTurn], message: Tuple[int, str, str]
+    ) -> PendingTurn:
+        """message에 대한 요청을 반환: 아직 요청하지 않았으면 새로 요청"""
+        key = make_turn_key(message) # 대화 내용이 바뀌면 같은 utterance_id라도 다시 요청
+        if key not in pending:
+            pending[key] = self.submit(make_query(message))
+        return pending[key]
+
+    def prefetch(
+        self,
+        pending: Dict[TurnKey, PendingTurn],
+        messages: Sequence[Tuple[int, str, str]],
+        index: int,
+        results: Optional[TurnResultStore] = None,
+    ) -> None:
+        """messages[index] 이후의 고객 발화 lookahead개를 미리 요청 (results에 이미 결과가 있거나 실패한 발화는 건너뜀)"""
+        remaining = self.lookahead
+        for i in range(index + 1, len(messages)):
+            if remaining <= 0:
+                break
+            if messages[i][2] == "고객":
+                if results is None or (results.get(messages[i]) is None and results.failure(messages[i]) is None):
+                    self.request(pending, messages[i])
+                remaining -= 1
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+
+def _timed_call(stage: str, timings: Dict[str, float], finished_at: Dict[str, float], func: Callable, *args) -> Any:
+    """백그라운드 스레드에서 func 실행 시간을 기록: 세션 상태는 사용할 수 없으므로 프로세스 저장소와 timings에 저장"""
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        finished = time.perf_counter()
+        timings[stage] = finished - started
+        finished_at[stage] = finished
+        PROCESS_PERF.record(stage, finished - started)
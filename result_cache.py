@@ -0,0 +1,200 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Callable, Dict, Optional
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 인텐트/요약 결과 캐시 기본 설정: 환경 변수로 변경 가능 (기본 경로는 실행 위치와 관계없이 저장소 기준)
+DEFAULT_RESULT_CACHE_PATH = os.getenv("RESULT_CACHE_PATH", os.path.join(ROOT_DIR, "cache", "llm_results.sqlite3"))
+DEFAULT_RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", str(7 * 24 * 3600))) # 초
+DEFAULT_RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "100000"))
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    query TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_expires_at ON results (expires_at);
+CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at);
+"""
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 query 정규화: 유니코드 NFC, 연속 공백을 한 칸으로, 앞뒤 공백 제거"""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", query)).strip()
+
+
+class ResultCache:
+    """
+    인텐트/요약 결과를 저장하는 디스크 캐시 (SQLite, WAL 모드)
+    - 키: 모델 이름 + 결과 종류(intent / summary) + 정규화한 query
+    - 여러 세션(스레드)과 여러 프로세스가 같은 파일을 동시에 읽고 쓸 수 있음 (스레드마다 연결 사용)
+    - ttl이 지난 항목은 조회되지 않고, max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+    - hits / misses 카운터로 캐시 효율 확인 가능 (프로세스 단위)
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_RESULT_CACHE_PATH,
+        model_name: str = "",
+        ttl: float = DEFAULT_RESULT_CACHE_TTL,
+        max_entries: int = DEFAULT_RESULT_CACHE_MAX_ENTRIES,
+        prune_interval: int = 200,
+        stats_interval: float = 5.0,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다")
+        self.path = path
+        self.model_name = model_name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.prune_interval = prune_interval # 쓰기 prune_interval번마다 만료/초과 항목 정리
+        self.stats_interval = stats_interval # stats()의 항목 수 조회 결과를 재사용하는 시간 (초)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._writes = 0
+        self._size = None # (조회 시각, 항목 수)
+        self._lock = threading.Lock() # 카운터 보호
+        self._local = threading.local()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connect().executescript(_SCHEMA)
+        self.prune()
+
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None) # autocommit
+            conn.execute("PRAGMA journal_mode=WAL") # 읽기와 쓰기가 서로 막지 않음
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def make_key(self, kind: str, query: str) -> str:
+        text = f"{self.model_name}\x00{kind}\x00{normalize_query(query)}"
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, kind: str, query: str) -> Optional[Any]:
+        """저장된 결과 반환 (없거나 만료되면 None)"""
+        key = self.make_key(kind, query)
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value FROM results WHERE key = ? AND expires_at > ?", (key, now)).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, kind: str, query: str, value: Any) -> None:
+        """결과 저장: JSON으로 저장할 수 없는 값은 저장하지 않음"""
+        try:
+            data = json.dumps(value, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"[WARNING] 결과 캐시 저장 생략({kind}): {e}")
+            return
+        now = time.time()
+        self._connect().execute(
+            "INSERT OR REPLACE INTO results (key, model, kind, query, value, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (self.make_key(kind, query), self.model_name, kind, normalize_query(query), data, now + self.ttl, now),
+        )
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % self.prune_interval == 0
+        if prune:
+            self.prune()
+
+    def get_or_compute(self, kind: str, query: str, compute: Callable[[], Any]) -> Any:
+        """저장된 결과가 있으면 반환하고, 없으면 compute()를 실행해 저장 후 반환"""
+        try:
+            cached = self.get(kind, query)
+        except sqlite3.Error as e: # 캐시 오류로 요청이 실패하지 않도록 함
+            logger.error(f"[ERROR] 결과 캐시 조회 실패: {e}")
+            return compute()
+        if cached is not None:
+            return cached
+        value = compute()
+        try:
+            self.set(kind, query, value)
+        except sqlite3.Error as e:
+            logger.error(f"[ERROR] 결과 캐시 저장 실패: {e}")
+        return value
+
+    def prune(self) -> int:
+        """만료된 항목과 max_entries를 넘는 항목(오래 사용되지 않은 순) 제거, 제거한 수 반환"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE") # 다른 프로세스와 동시에 정리하지 않도록 쓰기 잠금
+        try:
+            removed = conn.execute("DELETE FROM results WHERE expires_at <= ?", (time.time(),)).rowcount
+            overflow = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                removed += conn.execute(
+                    "DELETE FROM results WHERE key IN "
+                    "(SELECT key FROM results ORDER BY accessed_at LIMIT ?)", (overflow,)).rowcount
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self.evictions += removed
+        return removed
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM results")
+        self._size = None
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def _cached_size(self) -> Optional[int]:
+        """항목 수: stats_interval 동안은 마지막 조회 결과 사용, 조회 실패 시 None"""
+        now = time.monotonic()
+        if self._size is not None and now - self._size[0] < self.stats_interval:
+            return self._size[1]
+        try:
+            size = len(self)
+        except sqlite3.Error as e:
+            logger.warning(f"[WARNING] 결과 캐시 항목 수 조회 실패: {e}")
+            return None
+        self._size = (now, size)
+        return size
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태(hits, misses, hit_rate, evictions, size) 반환: 화면 갱신마다 호출되므로 DB 오류가 나도 예외를 내지 않음"""
+        size = self._cached_size()
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "evictions": self.evictions,
+                "size": size,
+            }
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
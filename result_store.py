@@ -0,0 +1,77 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+TurnKey = Tuple[int, str] # (utterance_id, 문장 해시)
+
+
+def make_turn_key(message: Tuple[int, str, str]) -> TurnKey:
+    """(utterance_id, sentence, speaker) -> 결과 저장 키: 대화 내용이 바뀌면 키도 바뀜"""
+    utterance_id, sentence, speaker = message
+    digest = hashlib.blake2b(f"{speaker}\x00{sentence}".encode("utf-8"), digest_size=8).hexdigest()
+    return utterance_id, digest
+
+
+@dataclass
+class TurnResult:
+    """고객 발화 하나의 인텐트/요약 결과"""
+    utterance_id: int
+    intent_data: Dict[str, Any] # 인텐트 API 응답 전체
+    summary: Any
+    intent_elapsed: Optional[float] = None # 측정한 인텐트 요청 시간(초)
+    total_elapsed: Optional[float] = None # 측정한 인텐트 + 요약 전체 시간(초)
+
+    @property
+    def intent(self) -> Any:
+        return self.intent_data.get("Intent")
+
+    @property
+    def request(self) -> Any:
+        return self.intent_data.get("Request")
+
+
+class TurnResultStore:
+    """
+    세션별 발화 결과 저장소: (utterance_id, 문장 해시) -> TurnResult
+    이미 결과가 있는 발화를 다시 보거나 화면을 다시 그릴 때는 dict 조회만 수행
+    요청이 실패한 발화는 오류 메시지를 따로 기록: 다시 시도(clear_failure)하기 전까지 다시 요청하지 않음
+    """
+
+    def __init__(self):
+        self._results: Dict[TurnKey, TurnResult] = {}
+        self._failures: Dict[TurnKey, str] = {}
+
+    def get(self, message: Tuple[int, str, str]) -> Optional[TurnResult]:
+        return self._results.get(make_turn_key(message))
+
+    def put(self, message: Tuple[int, str, str], result: TurnResult) -> None:
+        key = make_turn_key(message)
+        self._results[key] = result
+        self._failures.pop(key, None)
+
+    def failure(self, message: Tuple[int, str, str]) -> Optional[str]:
+        """요청이 실패한 발화의 오류 메시지 (실패하지 않았으면 None)"""
+        return self._failures.get(make_turn_key(message))
+
+    def mark_failed(self, message: Tuple[int, str, str], error: str) -> None:
+        self._failures[make_turn_key(message)] = error
+
+    def clear_failure(self, message: Tuple[int, str, str]) -> None:
+        self._failures.pop(make_turn_key(message), None)
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._failures.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+def last_customer_message(
+    messages: Sequence[Tuple[int, str, str]], index: int
+) -> Optional[Tuple[int, str, str]]:
+    """messages[index]부터 앞쪽으로 가장 가까운 고객 발화 (없으면 None)"""
+    for i in range(min(index, len(messages) - 1), -1, -1):
+        if messages[i][2] == "고객":
+            return messages[i]
+    return None
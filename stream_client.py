@@ -0,0 +1,99 @@
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from intent_client import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+
+# 인텐트 + 요약 스트리밍 API 기본 주소: 환경 변수로 변경 가능
+DEFAULT_LLM_STREAM_URL = os.getenv("LLM_STREAM_URL", "http://192.168.0.90:43307/llm_stream")
+
+
+@dataclass
+class StreamResult:
+    """스트리밍 응답 하나의 누적 결과와 시간 측정값"""
+    intent_data: Dict[str, Any] = field(default_factory=dict)
+    summary: str = ""
+    started_at: float = field(default_factory=time.perf_counter)
+    intent_at: Optional[float] = None # intent 이벤트 수신 시각
+    first_token_at: Optional[float] = None # 첫 요약 토큰 수신 시각
+    finished_at: Optional[float] = None # done 이벤트 수신 시각
+
+    def time_to_first_token(self) -> Optional[float]:
+        return self.first_token_at - self.started_at if self.first_token_at is not None else None
+
+    def total_elapsed(self) -> Optional[float]:
+        return self.finished_at - self.started_at if self.finished_at is not None else None
+
+
+class StreamingLLMClient:
+    """
+    인텐트 + 요약 스트리밍 API(llm_stream) 클라이언트
+    - 응답은 chunked NDJSON: {"event": "intent"} -> {"event": "token"} ... -> {"event": "done"}
+    - 한 줄이 도착할 때마다 바로 처리하므로 화면에는 첫 토큰부터 표시 가능
+    - 스트림 도중에는 재시도하지 않음 (이미 출력한 토큰과 중복되므로)
+    """
+
+    def __init__(
+        self,
+        api_url: str = DEFAULT_LLM_STREAM_URL,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        pool_size: int = 10,
+    ):
+        self.api_url = api_url
+        self.timeout = (connect_timeout, read_timeout) # read timeout은 토큰 사이 대기 시간에 적용
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def stream_events(self, query: str) -> Iterator[Dict[str, Any]]:
+        """query에 대한 이벤트(dict)를 도착하는 대로 반환 (JSON이 아니거나 객체가 아닌 줄은 ValueError)"""
+        with self.session.post(self.api_url, json={"query": query}, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    event = json.loads(line)
+                    if not isinstance(event, dict):
+                        raise ValueError(f"스트리밍 이벤트 형식 오류: {line[:100]!r}")
+                    yield event
+
+    def stream_summary(
+        self,
+        query: str,
+        result: StreamResult,
+        on_intent: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Iterator[str]:
+        """
+        요약 토큰(str)만 반환하는 generator: st.write_stream에 그대로 전달
+        intent 결과와 시간 측정값은 result에 기록하고, intent가 도착하면 on_intent(intent_data) 호출
+        """
+        for event in self.stream_events(query):
+            kind = event.get("event")
+            if kind == "intent":
+                intent_data = event.get("data", {})
+                if not isinstance(intent_data, dict):
+                    raise ValueError(f"인텐트 이벤트 형식 오류: {intent_data!r}")
+                result.intent_data = intent_data
+                result.intent_at = time.perf_counter()
+                if on_intent is not None:
+                    on_intent(result.intent_data)
+            elif kind == "token":
+                if result.first_token_at is None:
+                    result.first_token_at = time.perf_counter()
+                text = event.get("text", "")
+                if not isinstance(text, str):
+                    raise ValueError(f"토큰 이벤트 형식 오류: {text!r}")
+                result.summary += text
+                yield text
+            elif kind == "done":
+                break
+        result.finished_at = time.perf_counter()
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,117 @@
+"""
+로컬 개발/테스트용 인텐트 분류 API stub 서버
+
+- POST /llm_intent_select2: 인텐트 분류 결과(JSON)
+- POST /llm_stream: 인텐트 + 요약 토큰을 chunked NDJSON으로 스트리밍 (main.py 스트리밍 모드)
+
+실행:
+    python stub_server.py --port 43307 --delay 0.2 --token-delay 0.05
+    INTENT_API_URL=http://127.0.0.1:43307/llm_intent_select2 streamlit run app.py
+    LLM_STREAM_URL=http://127.0.0.1:43307/llm_stream streamlit run main.py
+"""
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+
+
+def fake_intent(query: str) -> Dict[str, Any]:
+    """query 내용과 상관없이 형식만 맞춘 인텐트 분류 결과"""
+    intent = "배송문의" if "배송" in query else "기타문의"
+    return {
+        "selected_intent_data": {"intent": intent, "query": query},
+        "intent_response_time": 0.0,
+        "Intent": intent,
+        "Request": query.split(") ", 1)[-1][:50],
+    }
+
+
+def fake_summary_tokens(query: str) -> List[str]:
+    """요약 문장을 토큰(어절) 단위로 나눈 목록: LLM 토큰 출력 흉내"""
+    sentence = query.split(") ", 1)[-1]
+    words = f"고객이 '{sentence}' 라고 문의함".split(" ")
+    return [word if i == 0 else " " + word for i, word in enumerate(words)]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # keep-alive 지원
+    delay = 0.0 # 응답 지연(초): LLM 응답 시간 흉내
+    token_delay = 0.0 # 스트리밍 토큰 사이 지연(초)
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _stream_ndjson(self, events: Iterator[Dict[str, Any]]) -> None:
+        """이벤트를 한 줄씩 chunked transfer encoding으로 전송"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for event in events:
+            self._send_chunk(json.dumps(event, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def _llm_stream_events(self, query: str) -> Iterator[Dict[str, Any]]:
+        """intent 이벤트 1개 -> token 이벤트 여러 개 -> done 이벤트"""
+        started = time.perf_counter()
+        time.sleep(self.delay)
+        yield {"event": "intent", "data": fake_intent(query)}
+        for token in fake_summary_tokens(query):
+            time.sleep(self.token_delay)
+            yield {"event": "token", "text": token}
+        yield {"event": "done", "elapsed": round(time.perf_counter() - started, 3)}
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_POST(self):
+        if self.path == "/llm_intent_select2":
+            started = time.perf_counter()
+            query = self._read_json().get("query", "")
+            time.sleep(self.delay)
+            body = fake_intent(query)
+            body["intent_response_time"] = round(time.perf_counter() - started, 3)
+            self._send_json(200, body)
+        elif self.path == "/llm_stream":
+            query = self._read_json().get("query", "")
+            self._stream_ndjson(self._llm_stream_events(query))
+        else:
+            self._send_json(404, {"detail": "Not Found"})
+
+    def log_message(self, format, *args):
+        pass # 요청마다 stderr 출력하지 않음
+
+
+def make_server(
+    host: str = "127.0.0.1", port: int = 43307, delay: float = 0.0, token_delay: float = 0.0
+) -> ThreadingHTTPServer:
+    handler = type("ConfiguredStubHandler", (StubHandler,), {"delay": delay, "token_delay": token_delay})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="인텐트 분류 API stub 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=43307)
+    parser.add_argument("--delay", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="스트리밍 토큰 사이 지연(초)")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.delay, args.token_delay)
+    print(f"stub server: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
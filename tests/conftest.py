@@ -0,0 +1,8 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 저장소 루트의 모듈(ledger.py, app.py ...)을 import할 수 있도록 추가
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,111 @@
+"""
+app.py 요약 결과 영역: 결과를 기다리는 동안만 주기적으로 다시 실행되는지 확인
+
+- AppTest는 run_every 타이머를 실행하지 않으므로, 실행마다 브라우저로 보내는 auto_rerun 메시지로 주기 실행 여부를 확인
+- 결과가 나온 뒤 주기 실행 fragment만 다시 실행하면 전체 실행으로 바뀌고, 그 실행에는 auto_rerun이 없어야 함
+- 인텐트 분류 API는 stub_server, 요약(core.generate_summary)은 테스트에서 끝나는 시점을 정하는 함수로 대체
+"""
+import os
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from conftest import ROOT
+
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData, ScriptRequests
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import app_test as app_test_module
+from streamlit.testing.v1.element_tree import parse_tree_from_messages
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner, require_widgets_deltas
+
+MESSAGES = [(0, "주문한 상품이 아직 배송되지 않았어요 polling", "고객"), (1, "확인해 보겠습니다", "상담사")]
+
+
+class FragmentScriptRunner(LocalScriptRunner):
+    """fragment_id가 설정되어 있으면 브라우저처럼 해당 fragment만 다시 실행하고, 마지막 실행의 메시지를 보관"""
+    fragment_id = None
+    messages = []
+
+    def run(self, widget_state=None, query_params=None, timeout=3, page_hash=""):
+        cls = FragmentScriptRunner
+        fragment_queue = [cls.fragment_id] if cls.fragment_id else []
+        if fragment_queue:
+            self._requests = ScriptRequests() # 생성자가 넣어 둔 전체 실행 요청과 합쳐지지 않도록 새로 만듦
+        self.request_rerun(RerunData(
+            widget_states=widget_state, page_script_hash=page_hash, fragment_id_queue=fragment_queue))
+        try:
+            if not self._script_thread:
+                self.start()
+            require_widgets_deltas(self, timeout)
+        finally:
+            self.join()
+        cls.messages = self.forward_msgs()
+        return parse_tree_from_messages(cls.messages)
+
+
+def auto_rerun_fragments():
+    return [m.auto_rerun.fragment_id for m in FragmentScriptRunner.messages if m.WhichOneof("type") == "auto_rerun"]
+
+
+def headings():
+    return [
+        m.delta.new_element.heading.body for m in FragmentScriptRunner.messages
+        if m.HasField("delta") and m.delta.new_element.WhichOneof("type") == "heading"
+    ]
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    from stub_server import make_server
+    server = make_server(host="127.0.0.1", port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    summary_ready = threading.Event()
+
+    def generate_summary(query, context):
+        summary_ready.wait(10)
+        return "요약"
+
+    monkeypatch.setitem(sys.modules, "core", types.SimpleNamespace(generate_summary=generate_summary))
+    monkeypatch.setenv("INTENT_API_URL", f"http://127.0.0.1:{server.server_port}/llm_intent_select2")
+    monkeypatch.setenv("RESULT_CACHE_PATH", str(tmp_path / "llm_results.sqlite3"))
+    monkeypatch.setattr(app_test_module, "LocalScriptRunner", FragmentScriptRunner)
+    monkeypatch.chdir(ROOT)
+    try:
+        yield AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=30), summary_ready
+    finally:
+        summary_ready.set()
+        server.shutdown()
+
+
+def test_polling_stops_after_result_arrives(app):
+    at, summary_ready = app
+    at.run()
+    at.session_state["split_speaker_sentence"] = MESSAGES
+    at.button(key="summarize_button").click().run()
+    at.button(key="next_button").click().run()
+
+    # 결과를 기다리는 중: 요약 결과 영역이 주기적으로 다시 실행됨
+    assert [info.value for info in at.info] == ["분석 중..."]
+    polling = auto_rerun_fragments()
+    assert len(polling) == 1
+
+    summary_ready.set()
+    deadline = time.monotonic() + 10
+    while not all(turn.done() for turn in at.session_state["pending_turns"].values()):
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+
+    # 주기 실행 fragment만 다시 실행 -> 결과를 본 fragment가 전체 실행을 요청
+    FragmentScriptRunner.fragment_id = polling[0]
+    try:
+        at.run()
+    finally:
+        FragmentScriptRunner.fragment_id = None
+    assert not at.exception
+    assert "Chatting Demo" in headings() # 전체 실행
+    assert auto_rerun_fragments() == [] # 더 이상 주기적으로 다시 실행하지 않음
+    assert not at.info
+    assert at.dataframe[0].value.iloc[3, 1] == "배송문의"
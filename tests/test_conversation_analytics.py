@@ -0,0 +1,43 @@
+import math
+
+from conversation_analytics import FRAME_CHUNK_ROWS, ConversationAnalytics
+from result_store import TurnResult
+
+
+def add(analytics, i):
+    if i % 2:
+        result = TurnResult(utterance_id=i, intent_data={"Intent": f"인텐트{i % 3}", "Request": "요청"},
+                            summary="요약", total_elapsed=0.25)
+        return analytics.append((i, f"고객 발화 {i}", "고객"), result)
+    return analytics.append((i, f"상담사 발화 {i}", "상담사"))
+
+
+def test_frame_appends_new_rows_and_keeps_earlier_frames():
+    analytics = ConversationAnalytics()
+    assert analytics.frame().empty
+    for i in range(3):
+        add(analytics, i)
+    first = analytics.frame()
+    assert analytics.frame() is first # 행이 추가되지 않으면 그대로 반환
+
+    for i in range(3, FRAME_CHUNK_ROWS * 2 + 5): # 열 배열이 두 번 이상 늘어나도록
+        add(analytics, i)
+        if i % 100 == 0:
+            analytics.frame()
+    df = analytics.frame()
+
+    assert len(analytics) == len(df) == FRAME_CHUNK_ROWS * 2 + 5
+    assert df["utterance_id"].tolist() == list(range(len(df)))
+    assert first["utterance_id"].tolist() == [0, 1, 2] # 이전 DataFrame은 바뀌지 않음
+    assert df["intent"].iloc[0] is None and df["intent"].iloc[1] == "인텐트1"
+    assert math.isnan(df["latency_ms"].iloc[0]) and df["latency_ms"].iloc[1] == 250.0
+    assert analytics.intent_distribution(df)["count"].sum() == len(df) // 2
+    assert analytics.talk_ratio(df)["turns"].to_dict() == {"고객": len(df) // 2, "상담사": len(df) - len(df) // 2}
+
+
+def test_duplicate_utterance_is_not_added_twice():
+    analytics = ConversationAnalytics()
+    assert add(analytics, 1)
+    analytics.frame()
+    assert not add(analytics, 1)
+    assert len(analytics.frame()) == 1
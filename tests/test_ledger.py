@@ -0,0 +1,45 @@
+from ledger import item_columns, parse_ledger
+
+LEDGER = """
+## 수입
+|연도|월|기본급|식대|지급총액|
+|:-:|:-:|:-:|:-:|:-:|
+|2024|4|900,000|100,000|1,000,000|
+|2024|5|900,000|100,000|1,000,000|
+
+## 공제금
+|연도|월|소득세|공제총액|
+|:-:|:-:|:-:|:-:|
+|2024|4|10,000|10,000|
+|2024|5|20,000|20,000|
+"""
+
+
+def test_numeric_month_column_is_key():
+    ledger = parse_ledger(LEDGER)
+    assert ledger.keys == ["연도", "월"]
+    assert item_columns(ledger.payments) == ["기본급", "식대"]
+    totals = ledger.totals()
+    assert totals["지급총액"].tolist() == [1000000, 1000000]
+    assert totals["차인지급액"].tolist() == [990000, 980000]
+    assert ledger.check().empty
+
+
+def test_first_column_is_key_regardless_of_name():
+    ledger = parse_ledger(LEDGER.replace("|연도|월|", "|회차|월|"))
+    assert ledger.keys == ["회차", "월"]
+    assert ledger.totals()["지급총액"].tolist() == [1000000, 1000000]
+
+
+def test_duplicate_keys_are_not_double_counted():
+    text = LEDGER.replace(
+        "|2024|5|900,000|100,000|1,000,000|", "|2024|5|900,000|100,000|1,000,000|\n|2024|5|500,000|-|500,000|"
+    ).replace("|2024|5|20,000|20,000|", "|2024|5|20,000|20,000|\n|2024|5|30,000|30,000|")
+    ledger = parse_ledger(text)
+    totals = ledger.totals()
+    assert len(totals) == 2
+    may = totals[totals["월"] == "5"].iloc[0]
+    assert (may["지급총액"], may["공제총액"], may["차인지급액"]) == (1500000, 50000, 1450000)
+
+    issues = ledger.check()
+    assert issues[["월", "검사", "항목"]].values.tolist() == [["5", "중복 키", "지급"], ["5", "중복 키", "공제"]]
@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+
+from conftest import ROOT
+
+from result_cache import ResultCache
+
+
+def test_default_path_does_not_depend_on_cwd(tmp_path):
+    env = {k: v for k, v in os.environ.items() if k != "RESULT_CACHE_PATH"}
+    env["PYTHONPATH"] = ROOT
+    out = subprocess.run(
+        [sys.executable, "-c", "import result_cache; print(result_cache.DEFAULT_RESULT_CACHE_PATH)"],
+        cwd=tmp_path, env=env, capture_output=True, text=True, check=True).stdout.strip()
+    assert out == os.path.join(ROOT, "cache", "llm_results.sqlite3")
+
+
+def test_stats_survives_database_error(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"), stats_interval=0)
+    cache.set("intent", "배송 문의", {"intent": "배송문의"})
+    assert cache.stats()["size"] == 1
+
+    cache._connect().close() # 이후 조회는 sqlite3.ProgrammingError
+    stats = cache.stats()
+    assert stats["size"] is None
+    assert stats["hits"] == 0 and stats["misses"] == 0
+
+
+def test_stats_reuses_size_within_interval(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"), stats_interval=60)
+    assert cache.stats()["size"] == 0
+    cache.set("intent", "배송 문의", {"intent": "배송문의"})
+    assert cache.stats()["size"] == 0 # 마지막 조회 결과 재사용
+    cache.clear()
+    cache.set("intent", "환불 문의", {"intent": "환불문의"})
+    assert cache.stats()["size"] == 1
@@ -0,0 +1,130 @@
+import mmap
+import os
+import re
+from collections.abc import Sequence
+from typing import Iterator, Optional, Union
+
+from chat_history import normalize_role
+from message_store import CompactConversation, Message
+from transcript_parser import SPEAKER_PATTERN
+
+# 서버 경로 입력을 허용하는 디렉터리: 환경 변수로 변경 가능
+DEFAULT_TRANSCRIPT_DIR = os.getenv("TRANSCRIPT_DIR", "data/transcripts")
+# 화면에 필요한 위치보다 미리 읽어 둘 발화 수 (prefetch가 다음 고객 발화를 찾을 수 있도록)
+LOAD_AHEAD = 8
+
+# main.py와 같은 화자 표기 규칙을 UTF-8 바이트에 적용: 첫 발화는 위치와 상관없이, 이후 발화는 줄 시작에서만 인식
+_SPEAKER_BYTES = SPEAKER_PATTERN.encode("utf-8")
+FIRST_SPEAKER_BYTES_RE = re.compile(_SPEAKER_BYTES)
+NEXT_SPEAKER_BYTES_RE = re.compile(rb"\n" + _SPEAKER_BYTES)
+# 화자 표기 뒤의 공백은 발화 내용보다 먼저 소비됨 (transcript_parser와 같은 규칙)
+LEADING_SPACE_BYTES_RE = re.compile(rb"\s*")
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+def iter_transcript_records(buffer: Buffer, start_id: int = 0) -> Iterator[Message]:
+    """
+    대화 전문 버퍼(UTF-8)에서 (utterance_id, sentence, speaker)를 하나씩 반환
+    - 버퍼 전체를 문자열로 바꾸지 않고, 발화 하나씩 잘라서 디코딩
+    - 내용이 빈 발화는 건너뜀, 상담사A / 상담사1 등은 '상담사'로 통일
+    """
+    match = FIRST_SPEAKER_BYTES_RE.search(buffer)
+    utterance_id = start_id
+    while match is not None:
+        speaker = normalize_role(match.group(1).decode("utf-8"))
+        content_start = LEADING_SPACE_BYTES_RE.match(buffer, match.end()).end()
+        match = NEXT_SPEAKER_BYTES_RE.search(buffer, content_start)
+        content_end = match.start() if match is not None else len(buffer)
+        sentence = bytes(buffer[content_start:content_end]).decode("utf-8", errors="replace").strip()
+        if sentence:
+            yield utterance_id, sentence, speaker
+            utterance_id += 1
+
+
+def iter_transcript_file(path: str) -> Iterator[Message]:
+    """파일을 메모리 매핑해 발화를 하나씩 반환: 파일 전체를 한 번에 읽지 않음"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from iter_transcript_records(mapped)
+
+
+def resolve_transcript_path(path: str, base_dir: str = DEFAULT_TRANSCRIPT_DIR) -> str:
+    """base_dir 아래의 파일 경로만 허용 (../ 등으로 벗어나면 ValueError)"""
+    base = os.path.realpath(base_dir)
+    resolved = os.path.realpath(os.path.join(base, path))
+    if os.path.commonpath([base, resolved]) != base:
+        raise ValueError(f"{base_dir} 밖의 파일은 읽을 수 없습니다: {path}")
+    if not os.path.isfile(resolved):
+        raise FileNotFoundError(f"파일이 없습니다: {path}")
+    return resolved
+
+
+class LazyTranscript(Sequence):
+    """
+    발화 generator를 필요한 만큼만 읽어 CompactConversation에 쌓는 Sequence
+    - len()은 지금까지 읽은 발화 수 (exhausted가 True가 되면 전체 발화 수)
+    - ensure(count)로 앞쪽 count개까지 읽어 둠: chat_index가 늘어날 때마다 호출
+    - 인덱스로 접근하면 해당 위치까지 자동으로 읽음
+    """
+
+    def __init__(self, records: Iterator[Message], name: str = ""):
+        self.name = name
+        self._records = records
+        self._loaded = CompactConversation()
+        self.exhausted = False
+
+    def ensure(self, count: int) -> int:
+        """앞쪽 count개까지 읽고 지금까지 읽은 발화 수 반환"""
+        while not self.exhausted and len(self._loaded) < count:
+            record = next(self._records, None)
+            if record is None:
+                self.exhausted = True
+                break
+            self._loaded.append(record)
+        return len(self._loaded)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.stop is None or index.stop < 0 or (index.start or 0) < 0:
+                self.ensure_all()
+            else:
+                self.ensure(index.stop)
+            return self._loaded[index]
+        if index < 0:
+            self.ensure_all()
+        else:
+            self.ensure(index + 1)
+        return self._loaded[index]
+
+    def __len__(self) -> int:
+        return len(self._loaded)
+
+    def ensure_all(self) -> int:
+        return self.ensure(float("inf"))
+
+    def close(self) -> None:
+        """generator와 파일 매핑 정리"""
+        close = getattr(self._records, "close", None)
+        if close is not None:
+            close()
+        self.exhausted = True
+
+    def __repr__(self) -> str:
+        state = "exhausted" if self.exhausted else "streaming"
+        return f"LazyTranscript({self.name!r}, {len(self)} messages loaded, {state})"
+
+
+def ensure_loaded(messages: Sequence, index: int, ahead: int = LOAD_AHEAD) -> None:
+    """messages가 LazyTranscript이면 index 이후 ahead개까지 읽어 둠 (그 외에는 아무 것도 하지 않음)"""
+    if isinstance(messages, LazyTranscript):
+        messages.ensure(index + 1 + ahead)
+
+
+def open_transcript(source: Union[str, Buffer], name: Optional[str] = None) -> LazyTranscript:
+    """파일 경로(str)는 메모리 매핑, 업로드 파일 등 버퍼는 그대로 읽는 LazyTranscript 생성"""
+    if isinstance(source, str):
+        return LazyTranscript(iter_transcript_file(source), name=name or os.path.basename(source))
+    return LazyTranscript(iter_transcript_records(source), name=name or "")
@@ -0,0 +1,97 @@
+import re
+from typing import List, Optional, Tuple
+
+# 화자 표기: 고객) / 상담사) / 상담사A) ...
+SPEAKER_PATTERN = r"(고객|상담사[a-zA-Z0-9]?)\)"
+# 첫 발화는 위치와 상관없이, 이후 발화는 줄 시작에서만 화자를 인식 (기존 정규식과 동일한 규칙)
+FIRST_SPEAKER_RE = re.compile(SPEAKER_PATTERN)
+NEXT_SPEAKER_RE = re.compile(r"\n" + SPEAKER_PATTERN)
+# 화자 표기 뒤의 공백은 발화 내용보다 먼저 소비됨 (기존 정규식의 `\)\s*`)
+LEADING_SPACE_RE = re.compile(r"\s*")
+
+# 이전 입력의 끝에 걸쳐 있는 화자 표기를 놓치지 않기 위해 다시 읽는 길이 ("\n상담사A)" = 6자)
+_RESCAN = 8
+# 이전 입력과 이어지는 텍스트인지 확인할 때 비교하는 앞 / 뒤 길이 (입력 길이와 상관없이 일정)
+_ANCHOR = 64
+
+
+class IncrementalTranscriptParser:
+    """
+    대화 전문을 (role, content) 발화 단위로 나누는 증분 파서
+    - 지금까지 읽은 위치(offset)와 아직 끝나지 않은 마지막 발화(partial entry)를 기억
+    - feed()는 새로 추가된 뒷부분만 읽고, 새로 생긴 발화만 반환
+    - 이전 입력과 이어지지 않는 텍스트(수정/삭제)가 들어오면 처음부터 다시 읽음
+      (이전 입력의 앞 / 끝 _ANCHOR자만 비교: 앞부분 중간을 고치면 위치가 밀려 끝부분 비교에서 걸림)
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._offset = 0 # 지금까지 읽은 텍스트 길이
+        self._head = "" # 직전 입력의 앞부분: 이어지는 텍스트인지 확인용
+        self._tail = "" # 직전 입력의 끝부분: 이어지는 텍스트인지 확인용
+        self._pending_role: Optional[str] = None # 아직 끝나지 않은 발화의 화자
+        self._pending_start = 0 # 아직 끝나지 않은 발화의 내용 시작 위치
+        self._emitted_tail: Optional[Tuple[str, str]] = None # 이미 반환한 마지막 발화
+
+    @property
+    def offset(self) -> int:
+        return self._offset
+
+    def _is_continuation(self, text: str) -> bool:
+        # 입력 전체가 아니라 앞 / 끝 일부만 비교: feed() 한 번의 비용이 새로 추가된 길이에만 비례
+        if len(text) < self._offset or not text.startswith(self._head):
+            return False
+        return text[self._offset - len(self._tail):self._offset] == self._tail
+
+    def feed(self, text: str) -> List[Tuple[str, str]]:
+        """
+        전체 대화 전문을 받아, 이전 호출 이후 새로 생긴 (role, content) 발화 목록을 반환
+        마지막 발화는 아직 이어질 수 있으므로, 내용이 바뀐 경우에만 다시 반환
+        """
+        if not self._is_continuation(text):
+            self.reset()
+
+        entries: List[Tuple[str, str]] = []
+
+        # 1. 첫 화자 표기 찾기
+        if self._pending_role is None:
+            match = FIRST_SPEAKER_RE.search(text, max(0, self._offset - _RESCAN))
+            if match is None:
+                self._advance(text)
+                return entries
+            self._pending_role = match.group(1)
+            self._pending_start = match.end()
+
+        # 2. 새로 추가된 부분에서 다음 화자 표기를 찾아 이전 발화를 닫음
+        scan_from = max(self._content_start(text), self._offset - _RESCAN)
+        while True:
+            match = NEXT_SPEAKER_RE.search(text, scan_from)
+            if match is None:
+                break
+            content = text[self._pending_start:match.start()].strip()
+            entry = (self._pending_role, content)
+            if entry != self._emitted_tail:
+                entries.append(entry)
+            self._emitted_tail = None
+            self._pending_role = match.group(1)
+            self._pending_start = match.end()
+            scan_from = self._content_start(text)
+
+        # 3. 마지막 발화: 내용이 바뀐 경우에만 반환
+        tail = (self._pending_role, text[self._pending_start:].strip())
+        if tail != self._emitted_tail:
+            entries.append(tail)
+            self._emitted_tail = tail
+
+        self._advance(text)
+        return entries
+
+    def _content_start(self, text: str) -> int:
+        return LEADING_SPACE_RE.match(text, self._pending_start).end()
+
+    def _advance(self, text: str) -> None:
+        self._offset = len(text)
+        self._head = text[:_ANCHOR]
+        self._tail = text[-_ANCHOR:]